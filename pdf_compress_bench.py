@@ -0,0 +1,357 @@
+"""pdf-compress performans ölçümleri.
+
+Örnek:
+    python pdf_compress_bench.py copy --pages 2000
+    python pdf_compress_bench.py encoders belge.pdf --dpi 150
+    python pdf_compress_bench.py save belge.pdf
+    python pdf_compress_bench.py corpus bench_corpus
+    python pdf_compress_bench.py run bench_corpus -o sonuc.json --baseline onceki.json
+"""
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import multiprocessing
+try:
+    import resource
+except ImportError:  # Windows: tepe RSS ölçülmez
+    resource = None
+
+try:
+    import pymupdf as fitz
+except ImportError:
+    import fitz
+from PIL import Image, ImageDraw, ImageFilter
+
+from pdf_compress_core import (DEFAULT_OPTIONS, SAVE_LEVELS, _compress_pages, _pixmap_to_image,
+                               _sample_pages, compare_encoders, compress_file, save_options)
+
+# Ayar matrisi: her belge bu kombinasyonların hepsiyle sıkıştırılır
+LEVELS = tuple(range(len(SAVE_LEVELS)))
+DPIS = (72, 96, 150)
+QUALITIES = (30, 50, 80)
+
+# Önceki ölçüme göre izin verilen en büyük kötüleşme (oran olarak)
+REGRESSION_THRESHOLD = 0.15
+
+# Sentetik derlem: ad -> (üretici, sayfa sayısı)
+CORPUS = {
+    "text": ("text", 50),
+    "scan": ("scan", 12),
+    "mixed": ("mixed", 20),
+    "large": ("text", 1200),
+}
+
+
+def make_text_pdf(pages, fonts=3):
+    """Ortak font kaynaklarını paylaşan, yalnızca metinden oluşan bellek içi PDF"""
+    doc = fitz.open()
+    fontnames = ["helv", "tiro", "cour"][:max(1, fonts)]
+    for page_num in range(pages):
+        page = doc.new_page()
+        for index, fontname in enumerate(fontnames):
+            lines = [f"Page {page_num + 1}, line {line + 1}: sample text content"
+                     for line in range(index, 40, len(fontnames))]
+            page.insert_text((50 + index * 5, 60 + index * 18), lines, fontname=fontname,
+                             fontsize=10, lineheight=18 * len(fontnames) / 10)
+    return fitz.open("pdf", doc.tobytes(no_new_id=True))
+
+
+def _scan_image(rng, width=1240, height=1754):
+    """Taranmış sayfayı andıran, tohumla belirlenen gri tonlu görüntü (PNG baytları)"""
+    img = Image.new("L", (width, height), 235)
+    draw = ImageDraw.Draw(img)
+    for line in range(60):
+        y = 80 + line * 26
+        x = 90
+        while x < width - 120:
+            word = rng.randint(20, 110)
+            draw.rectangle((x, y, x + word, y + 12), fill=rng.randint(20, 70))
+            x += word + rng.randint(10, 25)
+    img = img.filter(ImageFilter.GaussianBlur(1))
+    img = Image.merge("RGB", [img.point(lambda v, shift=shift: min(255, v + shift))
+                              for shift in (8, 4, 0)])
+    noise = Image.effect_noise((width, height), 12).convert("RGB")
+    img = Image.blend(img, noise, 0.08)
+    return _png_bytes(img)
+
+
+def _photo_image(rng, width=900, height=600):
+    """Yumuşak geçişli, fotoğraf benzeri renkli görüntü (PNG baytları)"""
+    img = Image.linear_gradient("L").resize((width, height))
+    channels = [img.rotate(rng.randint(0, 359)).point(lambda v, k=rng.random(): int(v * k))
+                for _ in range(3)]
+    img = Image.merge("RGB", channels).filter(ImageFilter.GaussianBlur(3))
+    return _png_bytes(img)
+
+
+def _png_bytes(img):
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def make_corpus(directory, seed=1):
+    """Derlemi `directory` içine üretir; aynı tohumla aynı dosyalar oluşur"""
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for name, (kind, pages) in CORPUS.items():
+        rng = random.Random(f"{seed}-{name}")
+        if kind == "text":
+            doc = make_text_pdf(pages)
+        else:
+            doc = fitz.open()
+            for page_num in range(pages):
+                page = doc.new_page()
+                if kind == "scan":
+                    page.insert_image(page.rect, stream=_scan_image(rng))
+                    continue
+                page.insert_text((50, 60), [f"Report page {page_num + 1}"] +
+                                 ["Body text for the mixed document."] * 12, fontsize=11)
+                page.insert_image(fitz.Rect(50, 320, 545, 650), stream=_photo_image(rng))
+                page.draw_rect(fitz.Rect(50, 680, 545, 780), color=(0, 0, 0.6), width=1)
+        path = os.path.join(directory, f"{name}.pdf")
+        # Sabit kimlik ve tarih, dosyaların bayt düzeyinde yeniden üretilebilmesi için
+        doc.set_metadata({})
+        doc.save(path, garbage=3, deflate=True, no_new_id=True)
+        doc.close()
+        paths[name] = path
+    return paths
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench_copy(pages):
+    """Sayfa sayfa `insert_pdf` ile motorun toplu aralık kopyasını karşılaştırır"""
+    doc = make_text_pdf(pages)
+    options = {**DEFAULT_OPTIONS, "quality": 100}
+
+    def per_page():
+        new_doc = fitz.open()
+        for page_num in range(pages):
+            new_doc.insert_pdf(doc, from_page=page_num, to_page=page_num)
+
+    def batched():
+        new_doc = fitz.open()
+        _compress_pages(doc, new_doc, 0, pages, options)
+
+    per_page_time = _timed(per_page)
+    batched_time = _timed(batched)
+    return {
+        "pages": pages,
+        "per_page_s": round(per_page_time, 3),
+        "batched_s": round(batched_time, 3),
+        "speedup": round(per_page_time / batched_time, 2) if batched_time else None,
+    }
+
+
+def bench_encoders(paths, dpi, quality, pages=4):
+    """Her kodlayıcının örnek sayfalardaki toplam süresi ve çıktı boyutu"""
+    options = {**DEFAULT_OPTIONS, "dpi": dpi, "quality": quality}
+    totals = {}
+    for path in paths:
+        doc = fitz.open(path)
+        for page_num in _sample_pages(len(doc), pages):
+            img = _pixmap_to_image(doc[page_num].get_pixmap(dpi=dpi))
+            for name, result in compare_encoders(img, options).items():
+                total = totals.setdefault(name, {"seconds": 0.0, "bytes": 0, "pages": 0})
+                total["seconds"] += result["seconds"]
+                total["bytes"] += result["bytes"]
+                total["pages"] += 1
+        doc.close()
+    return totals
+
+
+def bench_save(path):
+    """Her kaydetme profilini nesne akışlı ve akışsız dener: (profil, akış, sn, bayt)"""
+    source = fitz.open(path)
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="pdf_bench_") as folder:
+        output_path = os.path.join(folder, "out.pdf")
+        for level, profile in enumerate(SAVE_LEVELS):
+            for object_streams in (False, True):
+                params = save_options({**DEFAULT_OPTIONS, "compression_level": level,
+                                       "object_streams": object_streams})
+                if not object_streams and params.get("use_objstms"):
+                    continue
+                doc = fitz.open()
+                doc.insert_pdf(source)
+                seconds = _timed(lambda: doc.save(output_path, **params))
+                doc.close()
+                rows.append((profile, bool(params.get("use_objstms")), seconds,
+                             os.path.getsize(output_path)))
+    source.close()
+    return rows
+
+
+def _peak_rss():
+    """Sürecin tepe bellek kullanımı (bayt); `resource` yoksa None"""
+    if resource is None:
+        return None
+    # ru_maxrss Linux'ta KB, macOS'ta bayt cinsindendir
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _bench_case(file_path, options):
+    """Tek ölçüm; her ölçüm temiz bir süreçte koşar ki tepe RSS karışmasın"""
+    with tempfile.TemporaryDirectory(prefix="pdf_bench_") as output_folder:
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        result = compress_file(file_path, output_folder, options,
+                               lambda message: None, lambda done, total: None)
+        seconds = time.perf_counter() - start
+        cpu_seconds = time.process_time() - cpu_start
+    peak_rss = _peak_rss()
+    # Oran, "asla büyütme" korumasından önceki ham çıktıdan hesaplanır; koruma
+    # orijinali döndürdüğünde oran hep 1.0 kalır ve gerileme görünmezdi
+    raw_size = result["stats"]["stages"].get("save", {}).get("bytes") or result["compressed_size"]
+    return {
+        "pages": result["pages"],
+        "original_size": result["original_size"],
+        "compressed_size": result["compressed_size"],
+        "raw_size": raw_size,
+        "seconds": round(seconds, 4),
+        "cpu_seconds": round(cpu_seconds, 4),
+        "pages_per_s": round(result["pages"] / seconds, 2),
+        "mb_per_s": round(result["original_size"] / (1024 * 1024) / seconds, 3),
+        "peak_rss_mb": round(peak_rss / (1024 * 1024), 1) if peak_rss is not None else None,
+        "ratio": round(raw_size / result["original_size"], 4),
+    }
+
+
+def case_key(case):
+    return (f"{case['file']}|level={case['compression_level']}|dpi={case['dpi']}"
+            f"|quality={case['quality']}|mode={case['mode']}")
+
+
+def run_suite(paths, levels=LEVELS, dpis=DPIS, qualities=QUALITIES, mode="raster", log=print):
+    """Her belgeyi ayar matrisinin tamamıyla sıkıştırıp ölçüm listesi döndürür"""
+    cases = []
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=1, maxtasksperchild=1) as pool:
+        for name, path in paths.items():
+            for level in levels:
+                for dpi in dpis:
+                    for quality in qualities:
+                        options = {**DEFAULT_OPTIONS, "compression_level": level, "dpi": dpi,
+                                   "quality": quality, "mode": mode}
+                        case = {"file": name, "compression_level": level, "dpi": dpi,
+                                "quality": quality, "mode": mode}
+                        case.update(pool.apply(_bench_case, (path, options)))
+                        log(f"{case_key(case)}: {case['pages_per_s']} sayfa/sn, "
+                            f"{case['mb_per_s']} MB/sn, {case['peak_rss_mb'] or '?'} MB RSS, "
+                            f"oran {case['ratio']}")
+                        cases.append(case)
+    return cases
+
+
+def find_regressions(cases, baseline, threshold=REGRESSION_THRESHOLD):
+    """Önceki ölçüme göre eşikten fazla kötüleşen metrikleri listeler"""
+    previous = {case_key(case): case for case in baseline}
+    regressions = []
+    for case in cases:
+        old = previous.get(case_key(case))
+        if old is None:
+            continue
+        # Hız düşüşü, bellek ve çıktı boyutu artışı kötüleşme sayılır
+        checks = [
+            ("pages_per_s", old["pages_per_s"] * (1 - threshold), case["pages_per_s"] < old["pages_per_s"] * (1 - threshold)),
+            ("ratio", old["ratio"] * (1 + threshold), case["ratio"] > old["ratio"] * (1 + threshold)),
+        ]
+        # Tepe RSS iki ölçümde de varsa karşılaştırılır (Windows'ta ölçülmez)
+        if old.get("peak_rss_mb") is not None and case["peak_rss_mb"] is not None:
+            checks.append(("peak_rss_mb", old["peak_rss_mb"] * (1 + threshold),
+                           case["peak_rss_mb"] > old["peak_rss_mb"] * (1 + threshold)))
+        for metric, limit, failed in checks:
+            if failed:
+                regressions.append(f"{case_key(case)}: {metric} {old[metric]} -> {case[metric]} "
+                                   f"(sınır {round(limit, 4)})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="pdf-compress-bench", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    copy_parser = sub.add_parser("copy", help="olduğu gibi kopyalanan sayfaların hızı")
+    copy_parser.add_argument("--pages", type=int, nargs="+", default=[100, 500, 2000])
+    encoders_parser = sub.add_parser("encoders", help="kodlayıcıların hız ve boyut karşılaştırması")
+    encoders_parser.add_argument("files", nargs="+")
+    encoders_parser.add_argument("--dpi", type=int, default=DEFAULT_OPTIONS["dpi"])
+    encoders_parser.add_argument("--quality", type=int, default=DEFAULT_OPTIONS["quality"])
+    encoders_parser.add_argument("--pages", type=int, default=4, help="dosya başına örnek sayfa")
+    save_parser = sub.add_parser("save", help="kaydetme profillerinin süre ve boyut karşılaştırması")
+    save_parser.add_argument("files", nargs="+")
+    corpus_parser = sub.add_parser("corpus", help="sentetik test derlemini üret")
+    corpus_parser.add_argument("directory")
+    corpus_parser.add_argument("--seed", type=int, default=1)
+    run_parser = sub.add_parser("run", help="ayar matrisini derlem üzerinde ölç")
+    run_parser.add_argument("directory", help="derlem klasörü (yoksa üretilir)")
+    run_parser.add_argument("-o", "--output", default="bench_results.json")
+    run_parser.add_argument("--files", nargs="+", choices=CORPUS, default=list(CORPUS))
+    run_parser.add_argument("--levels", type=int, nargs="+", default=list(LEVELS))
+    run_parser.add_argument("--dpi", type=int, nargs="+", default=list(DPIS))
+    run_parser.add_argument("--quality", type=int, nargs="+", default=list(QUALITIES))
+    run_parser.add_argument("--mode", choices=("raster", "images", "auto"), default="raster")
+    run_parser.add_argument("--baseline", help="karşılaştırılacak önceki sonuç dosyası")
+    run_parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                            help="izin verilen kötüleşme oranı (varsayılan: 0.15)")
+    args = parser.parse_args(argv)
+
+    if args.command == "copy":
+        for pages in args.pages:
+            result = bench_copy(pages)
+            print(f"{result['pages']:>6} sayfa: sayfa sayfa {result['per_page_s']:.3f} sn, "
+                  f"toplu {result['batched_s']:.3f} sn ({result['speedup']}x)")
+        return 0
+
+    if args.command == "encoders":
+        totals = bench_encoders(args.files, args.dpi, args.quality, args.pages)
+        for name, total in sorted(totals.items(), key=lambda item: item[1]["seconds"]):
+            print(f"{name:>18}: {total['seconds'] / total['pages'] * 1000:7.1f} ms/sayfa, "
+                  f"{total['bytes'] / total['pages'] / 1024:8.1f} KB/sayfa")
+        return 0
+
+    if args.command == "save":
+        for path in args.files:
+            print(f"{os.path.basename(path)} ({os.path.getsize(path) / 1024:.0f} KB)")
+            for profile, object_streams, seconds, size in bench_save(path):
+                label = profile + (" + nesne akışı" if object_streams else "")
+                print(f"  {label:>22}: {seconds:7.3f} sn, {size / 1024:9.1f} KB")
+        return 0
+
+    if args.command == "corpus":
+        for path in make_corpus(args.directory, args.seed).values():
+            print(path)
+        return 0
+
+    paths = {name: os.path.join(args.directory, f"{name}.pdf") for name in args.files}
+    if not all(os.path.exists(path) for path in paths.values()):
+        make_corpus(args.directory)
+    cases = run_suite(paths, args.levels, args.dpi, args.quality, args.mode)
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump({"fitz": fitz.VersionBind, "cases": cases}, handle, indent=2)
+    print(f"{len(cases)} ölçüm yazıldı: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)["cases"]
+        regressions = find_regressions(cases, baseline, args.threshold)
+        for line in regressions:
+            print(f"❌ Gerileme: {line}")
+        if regressions:
+            return 1
+        print("✅ Gerileme yok")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""pdf-compress komut satırı arayüzü.
+
+Sunucularda ekran olmadan toplu sıkıştırma için; PyQt6 içe aktarılmaz.
+
+Örnek:
+    python pdf-compress.py "taramalar/**/*.pdf" -r -o cikti --jobs 8 --json
+    python pdf-compress.py --watch gelen -o cikti --status-file durum.json
+"""
+import argparse
+import glob
+import json
+import os
+import signal
+import sys
+
+from pdf_compress_core import (CHROMA_SUBSAMPLING, CLEANUP_CATEGORIES, DEFAULT_OPTIONS, IMAGE_ENCODERS,
+                               RESULT_CACHE_FILE, SAVE_LEVELS, JobControl, format_size, run_batch)
+
+LEVELS = {name: level for level, name in enumerate(SAVE_LEVELS)}
+
+
+def positive_int(value):
+    """argparse türü: 1 veya daha büyük tam sayı"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 veya daha büyük olmalı: {value}")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="pdf-compress",
+        description="PDF dosyalarını GUI olmadan sıkıştırır.")
+    parser.add_argument("inputs", nargs="+",
+                        help="PDF dosyaları, klasörler veya glob kalıpları")
+    parser.add_argument("-o", "--output", default=None,
+                        help="çıktı klasörü (varsayılan: her dosyanın kendi klasörü)")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="klasörleri ve ** kalıplarını alt klasörlerle birlikte tara")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="paralel işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--json", action="store_true",
+                        help="sonuçları JSON olarak stdout'a yaz")
+    parser.add_argument("--quiet", action="store_true",
+                        help="işlem günlüğünü yazdırma")
+    parser.add_argument("--cache", action="store_true",
+                        help="girdi ve ayarları değişmeyen dosyaları atla (manifesto çıktı klasöründe)")
+    parser.add_argument("--cache-file", default=None, metavar="YOL",
+                        help="önbellek manifestosunun yolu (--cache'i de açar)")
+    parser.add_argument("--timings", action="store_true",
+                        help="her dosyadan sonra aşama sürelerinin özetini yazdır")
+    parser.add_argument("--timing-report", default="", metavar="YOL",
+                        help="dosya ve sayfa bazında aşama sürelerini JSON/CSV olarak yaz")
+    parser.add_argument("--profile", default="", metavar="KLASÖR",
+                        help="her dosyayı cProfile altında çalıştırıp .prof çıktısını bu klasöre yaz")
+    parser.add_argument("--watch", action="store_true",
+                        help="girdi klasörünü izle, gelen PDF'leri açık kalan işçi havuzuyla sürekli sıkıştır")
+    parser.add_argument("--status-file", default="", metavar="YOL",
+                        help="izleme modunda verim, kuyruk ve gecikme ölçümlerinin yazılacağı JSON dosyası")
+    parser.add_argument("--status-port", type=int, default=0, metavar="PORT",
+                        help="izleme modunda ölçümleri http://127.0.0.1:PORT/ adresinden sun")
+    parser.add_argument("--poll", type=float, default=0, metavar="SN",
+                        help="olaylar yerine klasörü bu aralıkla tara (watchdog yoksa varsayılan 5 sn)")
+    parser.add_argument("--checkpoint", default="", metavar="YOL",
+                        help="biten dosyaları bu dosyaya kaydet; Ctrl+C ile durdurulan iş aynı "
+                             "komutla kaldığı yerden devam eder (--streaming ile dosya içinden de)")
+
+    settings = parser.add_argument_group("sıkıştırma ayarları")
+    settings.add_argument("-q", "--quality", type=int, default=DEFAULT_OPTIONS["quality"],
+                          help="JPEG kalitesi (10-95)")
+    settings.add_argument("--dpi", type=int, default=DEFAULT_OPTIONS["dpi"])
+    settings.add_argument("--max-image-size", type=int, default=DEFAULT_OPTIONS["max_image_size"],
+                          help="görüntülerin uzun kenarı için piksel sınırı")
+    settings.add_argument("--target-size", type=float, default=DEFAULT_OPTIONS["target_size_mb"],
+                          metavar="MB", help="çıktıyı bu boyutun altına indirecek kalite/DPI'ı otomatik seç")
+    settings.add_argument("--level", choices=LEVELS, default="high",
+                          help="kaydetme profili (fast: nesne toplama yok, ara çıktılar için)")
+    settings.add_argument("--object-streams", action="store_true",
+                          help="nesneleri sıkıştırılmış nesne akışlarına koy (max profilinde hep açık)")
+    settings.add_argument("--mode", choices=("raster", "images", "auto"), default=DEFAULT_OPTIONS["mode"],
+                          help="raster: sayfaları görüntüye çevir, images: yalnızca görüntüleri sıkıştır, "
+                               "auto: her sayfa için stratejiyi otomatik seç")
+    settings.add_argument("--encoder", choices=IMAGE_ENCODERS, default=DEFAULT_OPTIONS["encoder"],
+                          help="görüntü kodlayıcısı (jpeg: optimize, jpeg-fast: en hızlı, "
+                               "jpeg-progressive: daha küçük, jpx: JPEG 2000)")
+    settings.add_argument("--subsampling", choices=CHROMA_SUBSAMPLING, default="",
+                          help="JPEG renk alt örneklemesi (varsayılan: kodlayıcıya bırak)")
+    settings.add_argument("--gray", action="store_true",
+                          help="renksiz sayfa ve görüntüleri gri, siyah-beyazları 1 bit (CCITT G4) kodla")
+    settings.add_argument("--preflight", action="store_true",
+                          help="önce xref tablosundan bayt dağılımını ve tahmini kazancı çıkar; "
+                               "raster dosyayı büyütecekse görüntü moduna geç")
+    settings.add_argument("--min-savings", type=float, default=DEFAULT_OPTIONS["min_savings"],
+                          metavar="YÜZDE", help="tahmini kazancı bu yüzdenin altındaki dosyaları atla "
+                                                "(--preflight'ı da açar)")
+    settings.add_argument("--remove-images", action="store_true")
+    settings.add_argument("--remove-annotations", action="store_true",
+                          help="notları kaldır; bağlantılar ve form alanları korunur (--strip annotations)")
+    settings.add_argument("--strip", action="append", metavar="KATEGORİ",
+                          choices=[*CLEANUP_CATEGORIES, "all"],
+                          help="tek xref geçişinde kaldırılacak nesneler (tekrarlanabilir): "
+                               + ", ".join(CLEANUP_CATEGORIES) + " veya all")
+    settings.add_argument("--no-compress-fonts", action="store_true")
+    settings.add_argument("--optimize-fonts", action="store_true",
+                          help="sayfaları vektör olarak kopyalanan çıktılarda (images/auto, --remove-images, "
+                               "raster -q 100) özdeş gömülü "
+                               "fontları birleştir ve kullanılan gliflere indir")
+    settings.add_argument("--supersample", type=positive_int, default=DEFAULT_OPTIONS["supersample"],
+                          metavar="N", help="sayfayı N kat büyük render edip küçült (1: kapalı)")
+    settings.add_argument("--split-pages", action="store_true",
+                          help="dosyaları sırayla, sayfa aralıklarını paralel işle")
+    settings.add_argument("--streaming", action="store_true",
+                          help="sayfaları parçalar halinde diske boşaltarak belleği sınırla")
+    settings.add_argument("--chunk-pages", type=int, default=DEFAULT_OPTIONS["chunk_pages"])
+    settings.add_argument("--memory-limit", type=int, default=DEFAULT_OPTIONS["memory_limit_mb"],
+                          metavar="MB", help="akışlı işlem için bellek sınırı (0: sınırsız)")
+    settings.add_argument("--encode-threads", type=int, default=DEFAULT_OPTIONS["encode_threads"],
+                          metavar="N", help="render ile eşzamanlı kodlama yapan iş parçacığı sayısı (0: sıralı)")
+    settings.add_argument("--image-cache", type=int, default=DEFAULT_OPTIONS["image_cache_mb"],
+                          metavar="MB", help="görüntü önbelleği boyutu")
+    return parser
+
+
+def collect_inputs(patterns, recursive):
+    """Dosya, klasör ve glob kalıplarını sıralı, tekrarsız PDF listesine çevir"""
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            if recursive:
+                matches = glob.glob(os.path.join(pattern, "**", "*.pdf"), recursive=True)
+            else:
+                matches = glob.glob(os.path.join(pattern, "*.pdf"))
+        elif glob.has_magic(pattern):
+            matches = [path for path in glob.glob(pattern, recursive=recursive)
+                       if path.lower().endswith(".pdf")]
+        else:
+            matches = [pattern]
+        files.extend(os.path.abspath(path) for path in sorted(matches))
+    return list(dict.fromkeys(files))
+
+
+def options_from_args(args):
+    return {
+        **DEFAULT_OPTIONS,
+        "quality": args.quality,
+        "dpi": args.dpi,
+        "remove_images": args.remove_images,
+        "remove_annotations": args.remove_annotations,
+        "compress_fonts": not args.no_compress_fonts,
+        "optimize_fonts": args.optimize_fonts,
+        "max_image_size": args.max_image_size,
+        "compression_level": LEVELS[args.level],
+        "workers": max(1, args.jobs),
+        "split_pages": args.split_pages,
+        "supersample": args.supersample,
+        "mode": args.mode,
+        "image_cache_mb": args.image_cache,
+        "encode_threads": max(0, args.encode_threads),
+        "streaming": args.streaming,
+        "chunk_pages": args.chunk_pages,
+        "memory_limit_mb": args.memory_limit,
+        "target_size_mb": args.target_size,
+        "result_cache": result_cache_path(args),
+        "encoder": args.encoder,
+        "chroma_subsampling": args.subsampling,
+        "gray_detect": args.gray,
+        "object_streams": args.object_streams,
+        "preflight": args.preflight,
+        "min_savings": args.min_savings,
+        "cleanup": tuple(CLEANUP_CATEGORIES) if "all" in (args.strip or ()) else tuple(args.strip or ()),
+        "timing_summary": args.timings,
+        "timing_report": os.path.abspath(args.timing_report) if args.timing_report else "",
+        "profile_dir": os.path.abspath(args.profile) if args.profile else "",
+        "checkpoint": os.path.abspath(args.checkpoint) if args.checkpoint else "",
+    }
+
+
+def result_cache_path(args):
+    if args.cache_file:
+        return os.path.abspath(args.cache_file)
+    if args.cache:
+        return os.path.abspath(os.path.join(args.output or os.getcwd(), RESULT_CACHE_FILE))
+    return ""
+
+
+def watch(parser, args):
+    """Klasör izleme servisini Ctrl+C veya SIGTERM gelene kadar çalıştır"""
+    from pdf_compress_watch import POLL_INTERVAL, FolderWatcher
+    
+    if len(args.inputs) != 1 or not os.path.isdir(args.inputs[0]):
+        parser.error("--watch için tek bir girdi klasörü verin")
+    if not args.output:
+        parser.error("--watch için çıktı klasörü (-o) gerekli")
+
+    def log(message):
+        if not args.quiet:
+            print(message, file=sys.stderr, flush=True)
+
+    watcher = FolderWatcher(args.inputs[0], args.output, options_from_args(args), log,
+                            status_path=os.path.abspath(args.status_file) if args.status_file else "",
+                            status_port=args.status_port, poll_interval=args.poll or POLL_INTERVAL,
+                            use_events=not args.poll)
+    signal.signal(signal.SIGINT, lambda signum, frame: watcher.stop())
+    signal.signal(signal.SIGTERM, lambda signum, frame: watcher.stop())
+    watcher.run()
+    return 0
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.watch:
+        return watch(parser, args)
+    files = collect_inputs(args.inputs, args.recursive)
+    if not files:
+        parser.error("eşleşen PDF dosyası bulunamadı")
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+
+    def log(message):
+        if not args.quiet:
+            print(message, file=sys.stderr, flush=True)
+
+    # İlk Ctrl+C işi sayfa arasında durdurur, ikincisi hemen çıkar
+    control = JobControl()
+
+    def interrupt(signum, frame):
+        if control.cancelled:
+            raise KeyboardInterrupt
+        control.cancel()
+        log("⏹ Durduruluyor: geçerli sayfa bitince iş sonlanacak (hemen çıkmak için tekrar Ctrl+C)")
+
+    previous_handler = signal.signal(signal.SIGINT, interrupt)
+    try:
+        results = run_batch(files, args.output, options_from_args(args), log,
+                            lambda index, fraction: None, control)
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+    failed = [result for result in results if "error" in result]
+    if args.json:
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    else:
+        original = sum(result["original_size"] for result in results if "error" not in result)
+        compressed = sum(result["compressed_size"] for result in results if "error" not in result)
+        kept = sum(1 for result in results if result.get("kept_original"))
+        print(f"{len(results) - len(failed)}/{len(results)} dosya sıkıştırıldı: "
+              f"{format_size(original)} -> {format_size(compressed)}"
+              + (f" ({kept} dosyada kazanç olmadığı için orijinal korundu)" if kept else ""))
+    if control.cancelled:
+        return 130
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,2489 @@
+"""PDF sıkıştırma motoru - PyQt6'dan bağımsız.
+
+GUI, komut satırı ve toplu iş süreçleri bu modülü kullanır; Qt içe aktarmaz.
+"""
+import os
+import io
+import csv
+import time
+import cProfile
+import tempfile
+import shutil
+import gc
+import re
+import zlib
+import hashlib
+import json
+import math
+import queue
+import signal
+import threading
+import multiprocessing
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+
+try:
+    import pymupdf as fitz  # PyMuPDF >= 1.24; `fitz` adı stdout'a kullanımdan kalkma uyarısı basar
+except ImportError:
+    import fitz
+from PIL import Image, ImageChops, features
+try:
+    import psutil
+except ImportError:  # İsteğe bağlı: yoksa /proc üzerinden ölçülür
+    psutil = None
+try:
+    import numpy as np
+except ImportError:  # İsteğe bağlı: yoksa renk algılama PIL ile yapılır
+    np = None
+try:
+    import fontTools
+except ImportError:  # İsteğe bağlı: yalnızca MuPDF'in alt kümelemesi başarısız olursa kullanılır
+    fontTools = None
+
+
+# Görüntü modunda yeniden kodlanabilen renk uzayları
+RECOMPRESS_COLORSPACES = ("DeviceRGB", "DeviceGray", "ICCBased")
+
+# PIL'in JPEG renk alt örnekleme kodları ("" kodlayıcının varsayılanı)
+CHROMA_SUBSAMPLING = {"4:4:4": 0, "4:2:2": 1, "4:2:0": 2}
+
+# Renk algılama: kanallar arası farkı GRAY_TOLERANCE'ı aşan piksellerin
+# oranı COLOR_PIXEL_RATIO'nun altındaysa sayfa gri; gri sayfada ara tonların
+# (BILEVEL_MIDTONES) oranı BILEVEL_MIDTONE_RATIO'nun altındaysa siyah-beyazdır
+GRAY_TOLERANCE = 8
+COLOR_PIXEL_RATIO = 0.001
+BILEVEL_MIDTONES = (64, 192)
+BILEVEL_MIDTONE_RATIO = 0.12
+BILEVEL_THRESHOLD = 128
+# Renk kontrolü için düşük çözünürlüklü ön render ve örneklenen piksel sayısı
+COLOR_PROBE_DPI = 36
+DETECT_SAMPLE_PIXELS = 512 * 1024
+# 1 bit sayfalar bu çözünürlüğün altına indirilmez (düşük DPI'da metin bozulur)
+BILEVEL_DPI = 200
+
+# Kaydetme profilleri: `Document.save` parametreleri. `deflate_fonts` içermeyen
+# profillerde "compress_fonts" ayarı kullanılır. Doğrusallaştırma (linear) MuPDF
+# 1.26'dan beri desteklenmiyor ve nesne akışlarıyla birlikte istenemiyor.
+SAVE_PROFILES = {
+    "max": {"garbage": 4, "clean": True, "deflate": True, "deflate_images": True,
+            "deflate_fonts": True, "use_objstms": 1, "pretty": False},
+    "high": {"garbage": 3, "clean": True, "deflate": True, "deflate_images": True},
+    "normal": {"garbage": 1, "clean": True, "deflate": True, "deflate_images": True},
+    # Ara ya da atılacak çıktılar için: nesne toplama ve içerik temizliği yok
+    "fast": {"garbage": 0, "deflate": True},
+}
+# compression_level -> profil adı
+SAVE_LEVELS = ("max", "high", "normal", "fast")
+
+# Otomatik mod sınıflandırıcısı: bu eşiklerin üstündeki vektör içerik ya da
+# görüntü kaplaması (az metinle) rasterleştirilir
+AUTO_RASTER_CONTENT_BYTES = 512 * 1024
+AUTO_RASTER_COVERAGE = 0.9
+AUTO_RASTER_MIN_IMAGES = 4
+AUTO_RASTER_MAX_SPANS = 20
+
+# Sayfa aralığı paralelliği: bir parçadaki en az sayfa ve işçi başına parça sayısı
+MIN_SHARD_PAGES = 4
+SHARDS_PER_WORKER = 4
+# Toplu işte sıradaki dosyayı önceden okurken kullanılan blok boyu
+PREFETCH_BLOCK = 4 * 1024 * 1024
+
+# İlerleme: arayüz güncellemeleri arasındaki en kısa süre ve verimin ölçüldüğü pencere
+PROGRESS_INTERVAL = 0.25
+THROUGHPUT_WINDOW = 30.0
+
+# Hedef boyut modu: örnek sayfa sayısı, kalite aralığı, DPI kademeleri ve
+# tahmin hatasına karşı hedefin altında bırakılan pay
+TARGET_SAMPLE_PAGES = 8
+TARGET_MIN_QUALITY = 30
+TARGET_MAX_QUALITY = 95
+TARGET_DPI_STEPS = (200, 150, 120, 96, 72, 60, 50)
+TARGET_SAFETY_MARGIN = 0.95
+PAGE_OVERHEAD_BYTES = 400
+
+# Ön analiz: JPEG'in piksel başına bayt tahmini (kalite, metin sayfası,
+# fotoğraf/tarama). Ara değerler doğrusal olarak hesaplanır
+PREFLIGHT_BYTES_PER_PIXEL = (
+    (20, 0.020, 0.07),
+    (30, 0.025, 0.10),
+    (50, 0.032, 0.16),
+    (70, 0.040, 0.25),
+    (85, 0.050, 0.37),
+    (95, 0.065, 0.57),
+)
+PREFLIGHT_GRAY_FACTOR = 0.5
+# Ön analiz: filtresiz akışların deflate sonrası kalan payı ve alt kümelemeden
+# sonra gömülü fontlardan kalan pay (yapısal kazanç tahmini)
+PREFLIGHT_DEFLATE_RATIO = 0.3
+PREFLIGHT_FONT_FACTOR = 0.5
+# Dolaylı bir nesnenin akış dışı yükü: "n 0 obj", "endobj", akış işaretleri ve xref satırı
+PDF_OBJECT_OVERHEAD = 60
+# GUI'de "Ön Analiz" açıkken tahmini kazancı bu yüzdenin altındaki dosyalar atlanır
+PREFLIGHT_MIN_SAVINGS = 5
+
+# Görüntü önbelleğinde her girdiye veriden bağımsız sayılan bayt (anahtar,
+# demet ve sözlük yükü); boş "değmez" girdileri de bellek bütçesine girer
+IMAGE_CACHE_ENTRY_BYTES = 512
+
+# Gömülü font programını gösteren FontDescriptor anahtarları (Type1, TrueType, CFF/OpenType)
+FONT_FILE_KEYS = ("FontFile", "FontFile2", "FontFile3")
+
+# Sonuç önbelleği: manifesto dosya adı ve biçim sürümü. Sürüm, çıktıyı
+# değiştiren motor değişikliklerinde artırılır
+RESULT_CACHE_FILE = ".pdf-compress-cache.json"
+RESULT_CACHE_VERSION = 1
+# GUI'nin çıktı klasöründe tuttuğu kontrol noktası dosyası
+CHECKPOINT_FILE = ".pdf-compress-checkpoint.json"
+
+# Nesne temizliği kategorileri ve günlükteki adları. `remove_annotations`
+# eski davranışla uyumlu olarak yalnızca notları açar; bağlantılar ve form
+# alanları ayrıca seçilmedikçe korunur
+CLEANUP_CATEGORIES = {
+    "annotations": "notlar",
+    "links": "bağlantılar",
+    "widgets": "form alanları",
+    "embedded_files": "gömülü dosyalar",
+    "thumbnails": "küçük resimler",
+    "metadata": "XMP üst verisi",
+    "named_dests": "kullanılmayan adlı hedefler",
+    "javascript": "JavaScript",
+}
+
+# Varsayılan sıkıştırma ayarları (GUI'deki varsayılanlarla aynı)
+DEFAULT_OPTIONS = {
+    "quality": 50,
+    "dpi": 96,
+    "remove_images": False,
+    "remove_annotations": False,
+    "compress_fonts": True,
+    "max_image_size": 1600,
+    "compression_level": 1,
+    "workers": 1,
+    "split_pages": False,
+    "supersample": 1,
+    "mode": "raster",
+    "image_cache_mb": 64,
+    "streaming": False,
+    "chunk_pages": 50,
+    "memory_limit_mb": 0,
+    "target_size_mb": 0,
+    "result_cache": "",
+    "timing_summary": False,
+    "timing_report": "",
+    "profile_dir": "",
+    "encoder": "jpeg",
+    "chroma_subsampling": "",
+    "gray_detect": False,
+    "object_streams": False,
+    "checkpoint": "",
+    "preflight": False,
+    "min_savings": 0,
+    "encode_threads": 2,
+    "cleanup": (),
+    "optimize_fonts": False,
+}
+
+# Çıktının içeriğini değil yalnızca hızını/bellek kullanımını etkileyen ayarlar
+PERFORMANCE_OPTION_KEYS = frozenset({
+    "workers", "split_pages", "image_cache_mb", "streaming", "chunk_pages",
+    "memory_limit_mb", "result_cache", "timing_summary", "timing_report", "profile_dir",
+    "checkpoint", "encode_threads",
+})
+
+
+def format_size(size):
+    """Dosya boyutunu okunabilir formatta döndür"""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def format_duration(seconds):
+    """Süreyi ss:dd:sn (bir saatten kısaysa dd:sn) biçiminde döndür"""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+def _pixmap_to_image(pix):
+    """Pixmap örneklerini kopyalamadan PIL Image olarak sarmala"""
+    mode = {1: "L", 3: "RGB", 4: "RGBA"}[pix.n]
+    return Image.frombuffer(mode, (pix.width, pix.height), pix.samples_mv,
+                            "raw", mode, pix.stride, 1)
+
+
+def _render_matrix(page_rect, dpi, max_image_size, supersample=1):
+    """Pixmap'in doğrudan hedef boyutta çıkacağı render matrisini hesapla.
+
+    Hedef ölçek DPI'dan gelir, uzun kenar `max_image_size`'ı aşıyorsa ona
+    sıkıştırılır. `supersample` > 1 ise sayfa o kat büyük render edilir ve
+    sonradan hedef boyuta küçültülür. (matris, (genişlik, yükseklik)) döner.
+    """
+    zoom = dpi / 72
+    longest = max(page_rect.width, page_rect.height)
+    if longest * zoom > max_image_size:
+        zoom = max_image_size / longest
+    target_size = (max(1, round(page_rect.width * zoom)), max(1, round(page_rect.height * zoom)))
+    render_zoom = zoom * supersample
+    return fitz.Matrix(render_zoom, render_zoom), target_size
+
+
+def _replace_image_stream(doc, xref, data, size, image_filter="/DCTDecode"):
+    """Görüntü nesnesinin akışını kodlanmış veriyle değiştir, SMask gibi diğer anahtarları koru.
+
+    `/CCITTFaxDecode` ve `/FlateDecode` yalnızca 1 bit (siyah-beyaz) veri için
+    kullanılır, bkz. `_encode_bilevel`.
+    """
+    doc.update_stream(xref, data, compress=False)
+    doc.xref_set_key(xref, "Filter", image_filter)
+    doc.xref_set_key(xref, "Width", str(size[0]))
+    doc.xref_set_key(xref, "Height", str(size[1]))
+    if image_filter in ("/CCITTFaxDecode", "/FlateDecode"):
+        doc.xref_set_key(xref, "BitsPerComponent", "1")
+        doc.xref_set_key(xref, "ColorSpace", "/DeviceGray")
+        doc.xref_set_key(xref, "DecodeParms", "null" if image_filter == "/FlateDecode" else
+                         f"<</K -1/Columns {size[0]}/Rows {size[1]}/BlackIs1 true>>")
+        return
+    doc.xref_set_key(xref, "DecodeParms", "null")
+    doc.xref_set_key(xref, "BitsPerComponent", "8")
+    # Gri algılama renkli görüntüyü tek kanala indirdiyse renk uzayını eşitle
+    if (Image.open(io.BytesIO(data)).mode == "L"
+            and doc.xref_get_key(xref, "ColorSpace")[1] != "/DeviceGray"):
+        doc.xref_set_key(xref, "ColorSpace", "/DeviceGray")
+
+
+def _insert_image_data(page, rect, data, image_filter, size):
+    """Kodlanmış görüntüyü sayfaya ekle; 1 bit veri MuPDF'e yeniden kodlatılmaz"""
+    if image_filter in ("/DCTDecode", "/JPXDecode"):
+        page.insert_image(rect, stream=data)
+        return
+    # Yer tutucu 1x1 görüntü ekleyip akışını doğrudan G4/Flate veriyle değiştir
+    xref = page.insert_image(rect, pixmap=fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 1, 1), 0))
+    _replace_image_stream(page.parent, xref, data, size, image_filter)
+
+
+class ImageCache:
+    """Yeniden kodlanmış görüntüler için bellek sınırlı LRU önbellek.
+
+    Anahtar görüntünün içerik özeti ve hedef kodlama parametreleridir (piksel
+    boyutu dahil; farklı boyutta kullanılan kopyalar ayrı kodlanır); böylece
+    aynı logo veya arka plan bir toplu işte yalnızca bir kez kodlanır. Değer
+    (veri, PDF filtresi, piksel boyutu) üçlüsüdür; siyah-beyaz görüntülerde
+    boyut anahtardakinden büyük olabilir. Boş veri "yeniden kodlamaya değmez"
+    demektir. Her girdi bütçeye verisiyle birlikte IMAGE_CACHE_ENTRY_BYTES
+    kadar sayılır; böylece çok sayıda küçük görüntü önbelleği sınırsız büyütmez.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        data = self.entries.get(key)
+        if data is not None:
+            self.entries.move_to_end(key)
+        return data
+
+    def put(self, key, data, image_filter, size):
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key)[0]) + IMAGE_CACHE_ENTRY_BYTES
+        if len(data) + IMAGE_CACHE_ENTRY_BYTES > self.max_bytes:
+            return
+        self.entries[key] = (data, image_filter, size)
+        self.size += len(data) + IMAGE_CACHE_ENTRY_BYTES
+        while self.size > self.max_bytes:
+            _, (evicted, _, _) = self.entries.popitem(last=False)
+            self.size -= len(evicted) + IMAGE_CACHE_ENTRY_BYTES
+
+
+# Süreç başına paylaşılan görüntü önbelleği (işçi süreçlerde dosyalar arası da geçerli)
+_image_cache = None
+
+
+def _get_image_cache(options):
+    global _image_cache
+    max_bytes = options["image_cache_mb"] * 1024 * 1024
+    if _image_cache is None or _image_cache.max_bytes != max_bytes:
+        _image_cache = ImageCache(max_bytes)
+    return _image_cache
+
+
+def _image_digest(doc, xref, depth=3):
+    """Nesnenin ham akışı ve sözlüğünden içerik özeti üret.
+
+    Sözlükteki dolaylı başvurular (ICC renk uzayı, SMask vb.) xref numarası
+    yerine kendi içerik özetleriyle yer alır; böylece farklı kaynaklardan
+    kopyalanmış aynı görüntüler aynı özeti verir.
+    """
+    obj = re.sub(r"/Length \d+", "", doc.xref_object(xref, compressed=True))
+    if depth > 0:
+        obj = re.sub(r"(\d+) 0 R", lambda m: _image_digest(doc, int(m.group(1)), depth - 1), obj)
+    digest = hashlib.blake2b(obj.encode(), digest_size=16)
+    if doc.xref_is_stream(xref):
+        digest.update(doc.xref_stream_raw(xref))
+    return digest.hexdigest()
+
+
+def _set_xobject_ref(doc, page_xref, name, target_xref):
+    """Sayfanın /XObject kaynağındaki `name` girdisini `target_xref`'e yönlendir"""
+    owner, path = page_xref, ""
+    for key in ("Resources", "XObject"):
+        key_path = f"{path}/{key}" if path else key
+        kind, value = doc.xref_get_key(owner, key_path)
+        if kind == "xref":
+            # Dolaylı sözlük: düzenlemeyi doğrudan o nesne üzerinde yap
+            owner, path = int(value.split()[0]), ""
+        elif kind == "dict":
+            path = key_path
+        else:
+            return False
+    doc.xref_set_key(owner, f"{path}/{name}" if path else name, f"{target_xref} 0 R")
+    return True
+
+
+def _image_placements(doc, start, stop):
+    """[start, stop) sayfalarındaki her görüntünün en büyük yerleşimi (pt), içerik özetine göre.
+
+    Aynı görüntü birden fazla sayfada ya da farklı xref'lerle kullanılabilir;
+    küçültme hedefi ilk görüldüğü sayfadan değil tüm yerleşimlerin en büyüğünden
+    hesaplanır. Özet içeriğe dayandığından `insert_pdf` kopyalarında da aynıdır.
+    Sayfadaki görüntüler içerik akışından konumlanır (çözülmez); yalnızca form
+    nesnelerinin içindekiler için görüntü özetiyle eşleyen yavaş yol kullanılır.
+    """
+    by_xref = {}
+    for page_num in range(start, stop):
+        page = doc.load_page(page_num)
+        for item in page.get_images(full=True):
+            xref = item[0]
+            rects = [page.get_image_bbox(item)] if item[-1] == 0 else page.get_image_rects(xref)
+            for rect in rects:
+                by_xref[xref] = max(by_xref.get(xref, 0), rect.width, rect.height)
+    placements = {}
+    for xref, display in by_xref.items():
+        digest = _image_digest(doc, xref)
+        placements[digest] = max(placements.get(digest, 0), display)
+    return placements
+
+
+def _recompress_page_images(page, options, image_state, stats):
+    """Sayfadaki gömülü görüntülerden hedef DPI'ı aşanları küçültüp yeniden kodla.
+
+    Metin, font ve vektör içeriğe dokunulmaz. Aynı xref birden fazla sayfada
+    kullanılıyorsa yalnızca bir kez işlenir; içeriği aynı farklı xref'ler tek
+    bir nesneye yönlendirilir. Yönlendirilen kopyalar kanonik nesnenin boyutunu
+    paylaştığından hedef boyut, `image_state["placements"]` içindeki tüm
+    kopyaların en büyük yerleşimine göre seçilir.
+    """
+    doc = page.parent
+    aliases = image_state["aliases"]
+    by_digest = image_state["by_digest"]
+    placements = image_state["placements"]
+    for xref, _, width, height, bpc, colorspace, _, name, _, referencer in page.get_images(full=True):
+        canonical = aliases.get(xref)
+        if canonical is None:
+            digest = _image_digest(doc, xref)
+            canonical = by_digest.setdefault(digest, xref)
+            if canonical != xref and referencer != 0:
+                # İç içe form nesnelerindeki kopyalar yönlendirilmez, ayrıca işlenir
+                canonical = xref
+            aliases[xref] = canonical
+            if canonical == xref:
+                _recompress_image(page, xref, width, height, bpc, colorspace, digest,
+                                  options, stats, placements.get(digest, 0))
+            else:
+                stats["images_deduplicated"] += 1
+        if canonical != xref and referencer == 0:
+            _set_xobject_ref(doc, page.xref, name, canonical)
+
+
+def _image_target_size(page, xref, width, height, bpc, colorspace, options, display=0):
+    """Görüntünün hedef DPI'a göre yeni piksel boyutunu döndür.
+
+    `display` görüntünün başka sayfalardaki en büyük yerleşimidir (pt); bu
+    sayfadakiyle birlikte büyük olanı esas alınır. Görüntü yeniden
+    kodlanamıyorsa ya da zaten hedef çözünürlükteyse None döner.
+    """
+    doc = page.parent
+    if bpc != 8 or colorspace not in RECOMPRESS_COLORSPACES:
+        return None
+    if doc.xref_get_key(xref, "Decode")[0] != "null":
+        return None
+    
+    # En büyük yerleşime göre etkin çözünürlüğü hesapla; içeriği aynı kopyaların
+    # yerleşimi `display` içinde olduğundan bu sayfada bulunamaması yeterli değildir
+    rects = page.get_image_rects(xref)
+    display = max([display] + [max(rect.width, rect.height) for rect in rects])
+    if not display:
+        return None
+    longest = max(width, height)
+    target = min(display / 72 * options["dpi"], options["max_image_size"])
+    if longest <= target:
+        return None
+    scale = target / longest
+    return (max(1, round(width * scale)), max(1, round(height * scale)))
+
+
+def _decode_image(doc, xref):
+    """Görüntüyü PIL Image olarak çöz; RGB/gri olmayanlar için None döndür"""
+    # PNG'ye dönüştüren extract_image yerine ham örnekleri doğrudan çöz
+    pix = fitz.Pixmap(doc, xref)
+    if pix.n not in (1, 3) or pix.alpha:
+        return None
+    return _pixmap_to_image(pix).copy()
+
+
+def _save_image(img, **params):
+    img_buffer = io.BytesIO()
+    img.save(img_buffer, **params)
+    return img_buffer.getvalue()
+
+
+def _jpeg_params(options):
+    params = {"format": "JPEG", "quality": options["quality"]}
+    if options["chroma_subsampling"]:
+        params["subsampling"] = CHROMA_SUBSAMPLING[options["chroma_subsampling"]]
+    return params
+
+
+def _encode_jpeg(img, options):
+    """Huffman tabloları optimize edilmiş temel JPEG (varsayılan)"""
+    return _save_image(img, optimize=True, **_jpeg_params(options))
+
+
+def _encode_jpeg_fast(img, options):
+    """Optimizasyonsuz temel JPEG: en hızlısı, biraz daha büyük"""
+    return _save_image(img, **_jpeg_params(options))
+
+
+def _encode_jpeg_progressive(img, options):
+    """Aşamalı JPEG: daha küçük, kodlaması yaklaşık üç kat yavaş"""
+    return _save_image(img, optimize=True, progressive=True, **_jpeg_params(options))
+
+
+def _encode_jpx(img, options):
+    """JPEG 2000; kalite 10-95 aralığı 24-41 dB PSNR hedefine eşlenir (en yavaşı)"""
+    return _save_image(img, format="JPEG2000", irreversible=True, quality_mode="dB",
+                       quality_layers=[22 + options["quality"] * 0.2])
+
+
+# Kodlayıcı adı -> (fonksiyon, PDF filtresi)
+IMAGE_ENCODERS = {
+    "jpeg": (_encode_jpeg, "/DCTDecode"),
+    "jpeg-fast": (_encode_jpeg_fast, "/DCTDecode"),
+    "jpeg-progressive": (_encode_jpeg_progressive, "/DCTDecode"),
+    "jpx": (_encode_jpx, "/JPXDecode"),
+}
+
+
+def _detect_sample(img, reduce=True):
+    """Algılama için en fazla DETECT_SAMPLE_PIXELS piksellik örnek"""
+    step = max(1, math.isqrt(img.width * img.height // DETECT_SAMPLE_PIXELS))
+    if step == 1:
+        return img
+    if reduce:
+        return img.reduce(step)
+    # Ara tonları ortalamayla üretmemek için küçültmek yerine seyrek örnekle
+    return img.resize((img.width // step, img.height // step), Image.Resampling.NEAREST)
+
+
+def _is_grayscale(img):
+    """Kanal farkı eşiği aşan piksellerin oranı çok düşükse görüntü gridir"""
+    if img.mode == "L":
+        return True
+    sample = _detect_sample(img.convert("RGB") if img.mode != "RGB" else img)
+    if np is not None:
+        pixels = np.asarray(sample, dtype=np.int16)
+        spread = np.maximum(np.abs(pixels[..., 0] - pixels[..., 1]),
+                            np.abs(pixels[..., 1] - pixels[..., 2]))
+        return np.count_nonzero(spread > GRAY_TOLERANCE) <= spread.size * COLOR_PIXEL_RATIO
+    red, green, blue = sample.split()
+    spread = ImageChops.lighter(ImageChops.difference(red, green), ImageChops.difference(green, blue))
+    histogram = spread.histogram()
+    return sum(histogram[GRAY_TOLERANCE + 1:]) <= sample.width * sample.height * COLOR_PIXEL_RATIO
+
+
+def _is_bilevel(img):
+    """Gri görüntüde ara tonlar çok azsa siyah-beyaz (1 bit) kabul et"""
+    low, high = BILEVEL_MIDTONES
+    sample = _detect_sample(img, reduce=False)
+    if np is not None:
+        pixels = np.asarray(sample)
+        midtones = np.count_nonzero((pixels > low) & (pixels < high))
+    else:
+        midtones = sum(sample.histogram()[low + 1:high])
+    return midtones <= sample.width * sample.height * BILEVEL_MIDTONE_RATIO
+
+
+def _encode_bilevel(img):
+    """Gri görüntüyü eşikleyip 1 bit kodla: libtiff varsa CCITT G4, yoksa Flate"""
+    bilevel = img.point(lambda value: 255 if value >= BILEVEL_THRESHOLD else 0, mode="1")
+    if not features.check("libtiff"):
+        return zlib.compress(bilevel.tobytes(), 9), "/FlateDecode"
+    # Tek şerit (RowsPerStrip = yükseklik) ki G4 verisi TIFF'ten olduğu gibi alınabilsin;
+    # PIL "1" modunu MinIsBlack yazar, bu yüzden PDF'de BlackIs1 true kullanılır
+    data = _save_image(bilevel, format="TIFF", compression="group4", tiffinfo={278: bilevel.height})
+    tiff = Image.open(io.BytesIO(data))
+    offset, length = tiff.tag_v2[273][0], tiff.tag_v2[279][0]
+    return data[offset:offset + length], "/CCITTFaxDecode"
+
+
+def _color_class(img):
+    """Görüntüyü "color", "gray" veya "bilevel" olarak sınıflandır"""
+    if not _is_grayscale(img):
+        return "color"
+    return "bilevel" if _is_bilevel(img.convert("L") if img.mode != "L" else img) else "gray"
+
+
+def _encode_image(img, options, encoder=None, color=None):
+    """Görüntüyü seçili kodlayıcıyla kodla; (veri, PDF filtresi) döndürür.
+
+    `gray_detect` açıksa gri görüntüler tek kanal, siyah-beyazlar 1 bit
+    kodlanır. Sınıf önceden biliniyorsa `color` ile verilir.
+    """
+    encode, image_filter = IMAGE_ENCODERS[encoder or options["encoder"]]
+    if img.mode == "RGBA":
+        img = img.convert("RGB")
+    if options["gray_detect"]:
+        color = color or _color_class(img)
+        if color != "color" and img.mode != "L":
+            img = img.convert("L")
+        if color == "bilevel":
+            return _encode_bilevel(img)
+    return encode(img, options), image_filter
+
+
+def compare_encoders(img, options):
+    """Tüm kodlayıcıları aynı görüntüde dener; ad -> {"seconds", "bytes"} döndürür"""
+    results = {}
+    for name in IMAGE_ENCODERS:
+        start = time.perf_counter()
+        data, _ = _encode_image(img, options, name)
+        results[name] = {"seconds": time.perf_counter() - start, "bytes": len(data)}
+    return results
+
+
+def _recompress_image(page, xref, width, height, bpc, colorspace, digest, options, stats, display=0):
+    """Tek bir görüntü nesnesini gerekirse küçültüp JPEG olarak yeniden kodla.
+
+    Siyah-beyaz algılanan görüntüler, raster yolundaki gibi BILEVEL_DPI
+    etkin çözünürlüğün altına küçültülmez.
+    """
+    doc = page.parent
+    size = _image_target_size(page, xref, width, height, bpc, colorspace, options, display)
+    if size is None:
+        return
+    
+    cache = _get_image_cache(options)
+    key = (digest, size, options["quality"], options["encoder"], options["chroma_subsampling"],
+           options["gray_detect"])
+    cached = cache.get(key)
+    original_length = len(doc.xref_stream_raw(xref))
+    if cached is None:
+        with _stage(stats, "images/decode"):
+            img = _decode_image(doc, xref)
+        if img is None:
+            return
+        color = None
+        if options["gray_detect"]:
+            with _stage(stats, "images/detect"):
+                color = _color_class(img)
+            if color == "bilevel" and options["dpi"] < BILEVEL_DPI:
+                size = _image_target_size(page, xref, width, height, bpc, colorspace,
+                                          {**options, "dpi": BILEVEL_DPI}, display) or (width, height)
+        if size != (width, height):
+            with _stage(stats, "images/resize"):
+                img = img.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+        with _stage(stats, "images/encode") as record:
+            img_data, image_filter = _encode_image(img, options, color=color)
+            record["bytes"] = len(img_data)
+        
+        # Yalnızca gerçekten küçülen görüntüleri değiştir
+        if len(img_data) >= original_length:
+            img_data = b""
+        elif color in ("gray", "bilevel"):
+            stats[f"images_{color}"] += 1
+        cache.put(key, img_data, image_filter, size)
+    else:
+        img_data, image_filter, size = cached
+        stats["image_cache_hits"] += 1
+    
+    if img_data:
+        _replace_image_stream(doc, xref, img_data, size, image_filter)
+        stats["images_recompressed"] += 1
+        stats["image_bytes_saved"] += original_length - len(img_data)
+
+
+def _sample_pages(total_pages, count):
+    """Belgeye eşit aralıklarla yayılmış örnek sayfa numaraları"""
+    if total_pages <= count:
+        return list(range(total_pages))
+    return sorted({round(i * (total_pages - 1) / (count - 1)) for i in range(count)})
+
+
+class _SizeEstimator:
+    """Örnek sayfalardan verilen kalite/DPI için çıktı boyutunu tahmin eder.
+
+    Render edilen pixmap'ler (sayfa, dpi) ve kodlanmış boyutlar (sayfa veya
+    görüntü, dpi, kalite) anahtarıyla saklanır; arama adımları yalnızca eksik
+    olanları hesaplar.
+    """
+
+    def __init__(self, doc, file_size, options):
+        self.doc = doc
+        self.file_size = file_size
+        self.options = options
+        self.sample = _sample_pages(len(doc), TARGET_SAMPLE_PAGES)
+        self.pixmaps = {}
+        self.images = {}
+        self.sizes = {}
+        if options["mode"] in ("images", "auto"):
+            self.image_bytes = sum(len(doc.xref_stream_raw(xref)) for xref in range(1, doc.xref_length())
+                                   if doc.xref_get_key(xref, "Subtype")[1] == "/Image")
+
+    def estimate(self, dpi, quality):
+        options = {**self.options, "dpi": dpi, "quality": quality}
+        if options["mode"] in ("images", "auto"):
+            return self._estimate_images(options)
+        sample_bytes = sum(self._raster_page_size(page_num, options) for page_num in self.sample)
+        return sample_bytes / len(self.sample) * len(self.doc) + PAGE_OVERHEAD_BYTES * len(self.doc)
+
+    def _raster_page_size(self, page_num, options):
+        key = (page_num, options["dpi"], options["quality"])
+        if key not in self.sizes:
+            if (page_num, options["dpi"]) not in self.pixmaps:
+                page = self.doc.load_page(page_num)
+                mat, _ = _render_matrix(page.rect, options["dpi"], options["max_image_size"])
+                self.pixmaps[(page_num, options["dpi"])] = page.get_pixmap(matrix=mat)
+            img = _pixmap_to_image(self.pixmaps[(page_num, options["dpi"])])
+            self.sizes[key] = len(_encode_image(img, options)[0])
+        return self.sizes[key]
+
+    def _estimate_images(self, options):
+        # Görüntü dışı baytlar sabit kabul edilir, görüntüler örnekteki oranla küçülür
+        original = new = 0
+        seen = set()
+        for page_num in self.sample:
+            page = self.doc.load_page(page_num)
+            for xref, _, width, height, bpc, colorspace, *_ in page.get_images(full=True):
+                if xref in seen:
+                    continue
+                seen.add(xref)
+                length = len(self.doc.xref_stream_raw(xref))
+                original += length
+                new += self._image_size(page, xref, width, height, bpc, colorspace, length, options)
+        ratio = new / original if original else 1.0
+        return self.file_size - self.image_bytes + self.image_bytes * ratio
+
+    def _image_size(self, page, xref, width, height, bpc, colorspace, length, options):
+        size = _image_target_size(page, xref, width, height, bpc, colorspace, options)
+        if size is None:
+            return length
+        key = (xref, options["dpi"], options["quality"])
+        if key not in self.sizes:
+            if xref not in self.images:
+                self.images[xref] = _decode_image(self.doc, xref)
+            img = self.images[xref]
+            if img is None:
+                self.sizes[key] = length
+            else:
+                img = img.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+                self.sizes[key] = min(length, len(_encode_image(img, options)[0]))
+        return self.sizes[key]
+
+
+def _find_target_settings(doc, file_size, options, log):
+    """Hedef boyuta sığan en yüksek kalite/DPI çiftini örnek sayfalar üzerinde ara.
+
+    Önce kullanıcı DPI'ında kalite ikili aramayla bulunur; en düşük kabul
+    edilebilir kalite bile sığmıyorsa DPI kademeli olarak düşürülür.
+    """
+    target = options["target_size_mb"] * 1024 * 1024 * TARGET_SAFETY_MARGIN
+    estimator = _SizeEstimator(doc, file_size, options)
+    dpis = [options["dpi"]] + [dpi for dpi in TARGET_DPI_STEPS if dpi < options["dpi"]]
+
+    def best_quality(dpi, low, high):
+        # Boyut kaliteyle monoton artar: sığan en yüksek kaliteyi bul
+        if estimator.estimate(dpi, low) > target:
+            return None
+        while low < high:
+            middle = (low + high + 1) // 2
+            if estimator.estimate(dpi, middle) <= target:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    chosen = None
+    for dpi in dpis:
+        quality = best_quality(dpi, TARGET_MIN_QUALITY, TARGET_MAX_QUALITY)
+        if quality is not None:
+            chosen = {"dpi": dpi, "quality": quality}
+            break
+    if chosen is None:
+        quality = best_quality(dpis[-1], 10, TARGET_MIN_QUALITY)
+        chosen = {"dpi": dpis[-1], "quality": quality if quality is not None else 10}
+        if quality is None:
+            log("⚠️ Hedef boyuta en düşük ayarlarla bile ulaşılamayabilir")
+
+    estimate = estimator.estimate(chosen["dpi"], chosen["quality"])
+    log(f"Hedef boyut {options['target_size_mb']} MB: kalite {chosen['quality']}, "
+        f"{chosen['dpi']} DPI seçildi (tahmin {format_size(estimate)}, "
+        f"{len(estimator.sample)} örnek sayfa, {len(estimator.sizes)} kodlama)")
+    return chosen
+
+
+def _stream_length(doc, xref):
+    """Akışın dosyadaki (sıkıştırılmış) boyutu; mümkünse yalnızca /Length okunur"""
+    kind, value = doc.xref_get_key(xref, "Length")
+    if kind == "int":
+        return int(value)
+    if kind == "xref":
+        length = doc.xref_object(int(value.split()[0])).strip()
+        if length.isdigit():
+            return int(length)
+    return len(doc.xref_stream_raw(xref))
+
+
+def _int_key(doc, xref, key):
+    kind, value = doc.xref_get_key(xref, key)
+    return int(value) if kind == "int" else 0
+
+
+def _object_refs(text):
+    return [int(ref) for ref in re.findall(r"(\d+) \d+ R", text)]
+
+
+def analyze_pdf(doc, file_size):
+    """Belgenin baytlarını görüntü, font, içerik ve diğer olarak ayır.
+
+    Yalnızca xref tablosu ve nesne sözlükleri okunur; akışlar açılmaz,
+    sayfalar yüklenmez. Görüntülerin boyut ve renk bilgisi tahmin için saklanır.
+    Kaydetmenin yapısal kazancı için filtresiz akışların, birden çok parçaya
+    bölünmüş sayfa içeriklerinin ve trailer'dan ulaşılamayan (nesne toplamanın
+    sileceği) nesnelerin baytları da sayılır.
+    """
+    font_files, contents, streams, images = set(), set(), {}, []
+    breakdown = {"images": 0, "fonts": 0, "content": 0, "other": 0}
+    children, sizes, unfiltered, split_pages = {}, {}, {}, []
+    for xref in range(1, doc.xref_length()):
+        kind = doc.xref_get_key(xref, "Type")[1]
+        if kind in ("/ObjStm", "/XRef"):
+            continue
+        text = doc.xref_object(xref, compressed=True)
+        children[xref] = _object_refs(text)
+        sizes[xref] = len(text)
+        if kind == "/FontDescriptor":
+            for key in FONT_FILE_KEYS:
+                ref_kind, ref = doc.xref_get_key(xref, key)
+                if ref_kind == "xref":
+                    font_files.update(_object_refs(ref))
+        elif kind == "/Page":
+            refs = _object_refs(doc.xref_get_key(xref, "Contents")[1])
+            for ref in list(refs):
+                # /Contents dolaylı bir diziyi de gösterebilir
+                if 0 < ref < doc.xref_length() and not doc.xref_is_stream(ref):
+                    refs.extend(_object_refs(doc.xref_object(ref)))
+            contents.update(refs)
+            if len(refs) > 1:
+                split_pages.append(refs)
+        if not doc.xref_is_stream(xref):
+            continue
+        length = streams[xref] = _stream_length(doc, xref)
+        sizes[xref] += length
+        if doc.xref_get_key(xref, "Filter")[0] == "null":
+            unfiltered[xref] = length
+        subtype = doc.xref_get_key(xref, "Subtype")[1]
+        if subtype == "/Image":
+            breakdown["images"] += length
+            images.append({
+                "xref": xref,
+                "width": _int_key(doc, xref, "Width"),
+                "height": _int_key(doc, xref, "Height"),
+                "bpc": doc.xref_get_key(xref, "BitsPerComponent")[1],
+                "colorspace": doc.xref_get_key(xref, "ColorSpace")[1],
+                "length": length,
+            })
+        elif subtype == "/Form":
+            contents.add(xref)
+    for xref, length in streams.items():
+        if xref in font_files:
+            breakdown["fonts"] += length
+        elif xref in contents:
+            breakdown["content"] += length
+    # Akış dışı nesneler, xref tablosu ve tanınmayan akışlar
+    breakdown["other"] = max(0, file_size - breakdown["images"] - breakdown["fonts"]
+                             - breakdown["content"])
+    
+    reachable, pending = set(), _object_refs(doc.pdf_trailer())
+    while pending:
+        xref = pending.pop()
+        if xref in children and xref not in reachable:
+            reachable.add(xref)
+            pending.extend(children[xref])
+    # 8 bit görüntüler tahminde zaten yeniden kodlanmış sayılır
+    recoded = {image["xref"] for image in images if image["bpc"] == "8"}
+    image_xrefs = {image["xref"] for image in images} - recoded
+    split_xrefs = {ref for refs in split_pages for ref in refs}
+    uncompressed = {"images": 0, "fonts": 0, "split": 0, "other": 0}
+    for xref, length in unfiltered.items():
+        if xref in reachable and xref not in recoded:
+            key = ("images" if xref in image_xrefs else "fonts" if xref in font_files
+                   else "split" if xref in split_xrefs else "other")
+            uncompressed[key] += length
+    return {
+        "bytes": breakdown,
+        "images": images,
+        "uncompressed": uncompressed,
+        # `clean` parçalı içerikleri tek akışta birleştirip yeniden sıkıştırır
+        "split_content": sum(sizes.get(ref, 0) + PDF_OBJECT_OVERHEAD for ref in split_xrefs),
+        "unused": sum(size for xref, size in sizes.items() if xref not in reachable),
+        "page_rects": [doc.page_cropbox(page_num) for page_num in range(len(doc))],
+    }
+
+
+def _structural_savings(analysis, options, keep_images=True):
+    """Sayfaları vektör olarak kopyalayan modlarda kaydetmenin tahmini kazancı.
+
+    Nesne toplama ulaşılamayan nesneleri siler, `clean` parçalı sayfa
+    içeriklerini birleştirir, deflate filtresiz akışları küçültür;
+    `optimize_fonts` açıksa gömülü fontlar alt kümelenir.
+    """
+    params = save_options(options)
+    uncompressed = analysis["uncompressed"]
+    saved = analysis["unused"] if params.get("garbage") else 0
+    if params.get("clean"):
+        saved += analysis["split_content"] * (1 - PREFLIGHT_DEFLATE_RATIO)
+    fonts = analysis["bytes"]["fonts"]
+    if params.get("deflate"):
+        deflated = uncompressed["other"]
+        if not params.get("clean"):
+            deflated += uncompressed["split"]
+        if keep_images and params.get("deflate_images"):
+            deflated += uncompressed["images"]
+        if params.get("deflate_fonts"):
+            deflated += uncompressed["fonts"]
+            fonts -= uncompressed["fonts"] * (1 - PREFLIGHT_DEFLATE_RATIO)
+        saved += deflated * (1 - PREFLIGHT_DEFLATE_RATIO)
+    if options["optimize_fonts"]:
+        saved += fonts * (1 - PREFLIGHT_FONT_FACTOR)
+    return saved
+
+
+def _bytes_per_pixel(quality):
+    """Verilen JPEG kalitesi için (metin, fotoğraf) piksel başına bayt tahmini"""
+    table = PREFLIGHT_BYTES_PER_PIXEL
+    if quality <= table[0][0]:
+        return table[0][1:]
+    for (q0, text0, photo0), (q1, text1, photo1) in zip(table, table[1:]):
+        if quality <= q1:
+            t = (quality - q0) / (q1 - q0)
+            return text0 + (text1 - text0) * t, photo0 + (photo1 - photo0) * t
+    return table[-1][1:]
+
+
+def estimate_output_sizes(analysis, file_size, options):
+    """Ön analizden her strateji için tahmini çıktı boyutu: raster, images, text.
+
+    Kaba bir tahmindir; karar vermeye yeter, hedef boyut araması gibi sayfa
+    render etmez.
+    """
+    breakdown = analysis["bytes"]
+    page_rects = analysis["page_rects"]
+    text_bpp, photo_bpp = _bytes_per_pixel(options["quality"])
+    
+    # Raster: görüntülü ya da içeriği yoğun sayfa oranına göre metin/fotoğraf karışımı
+    pages = max(1, len(page_rects))
+    image_like = min(1.0, (len(analysis["images"])
+                           + breakdown["content"] / AUTO_RASTER_CONTENT_BYTES) / pages)
+    bpp = text_bpp + (photo_bpp - text_bpp) * image_like
+    raster = 0
+    for rect in page_rects:
+        _, (width, height) = _render_matrix(rect, options["dpi"], options["max_image_size"])
+        raster += width * height * bpp + PAGE_OVERHEAD_BYTES
+    
+    # Görüntü modu: hedef DPI'ı aşan 8 bit görüntüler küçültülüp yeniden kodlanır
+    longest_page = max((max(rect.width, rect.height) for rect in page_rects), default=0)
+    target = min(longest_page / 72 * options["dpi"], options["max_image_size"])
+    images_saved = 0
+    for image in analysis["images"]:
+        longest = max(image["width"], image["height"])
+        if image["bpc"] != "8" or not longest:
+            continue
+        scale = min(1.0, target / longest)
+        factor = PREFLIGHT_GRAY_FACTOR if "Gray" in image["colorspace"] else 1.0
+        estimate = image["width"] * image["height"] * scale * scale * photo_bpp * factor
+        images_saved += max(0, image["length"] - estimate)
+    
+    return {
+        "raster": round(raster),
+        "images": max(0, round(file_size - images_saved - _structural_savings(analysis, options))),
+        "text": max(0, round(file_size - breakdown["images"]
+                             - _structural_savings(analysis, options, keep_images=False))),
+    }
+
+
+def _preflight(doc, file_size, options, log, stats):
+    """Ön analizi çalıştırıp dosyanın stratejisini seç.
+
+    (ayarlar, analiz özeti, atlama nedeni) döndürür. Raster dosyayı
+    büyütecekse ve görüntü modunun tahmini daha küçükse görüntü moduna geçilir;
+    kullanıcının seçtiği görüntü modu metni koruduğu için hiç raster'a
+    çevrilmez. Tahmin `min_savings` yüzdesinin altında kalıyorsa atlama nedeni döner.
+    """
+    with _stage(stats, "preflight"):
+        analysis = analyze_pdf(doc, file_size)
+        estimates = estimate_output_sizes(analysis, file_size, options)
+    breakdown = analysis["bytes"]
+    log("Ön analiz: " + ", ".join(
+        f"{label} {format_size(breakdown[key])} (%{breakdown[key] / file_size * 100:.0f})"
+        for key, label in (("images", "görüntü"), ("fonts", "font"),
+                           ("content", "içerik"), ("other", "diğer"))))
+    log(f"  Tahmini çıktı: raster ~{format_size(estimates['raster'])}, "
+        f"görüntü modu ~{format_size(estimates['images'])}, "
+        f"yalnız metin ~{format_size(estimates['text'])}")
+    
+    mode = options["mode"]
+    if options["remove_images"]:
+        expected = estimates["text"]
+    elif mode == "auto":
+        expected = min(estimates["raster"], estimates["images"])
+    else:
+        if (mode == "raster" and estimates["raster"] >= file_size
+                and estimates["images"] < estimates["raster"]):
+            log("  Strateji: raster dosyayı büyütecek, images kullanılıyor")
+            options = {**options, "mode": "images"}
+            mode = "images"
+        expected = estimates[mode]
+    
+    savings = (1 - expected / file_size) * 100
+    summary = {"bytes": breakdown, "estimates": estimates, "mode": mode,
+               "expected_savings": round(savings, 2)}
+    skip_reason = None
+    if options["min_savings"] and savings < options["min_savings"]:
+        skip_reason = f"tahmini kazanç %{savings:.1f} < %{options['min_savings']}"
+    return options, summary, skip_reason
+
+
+# Adlı hedef kullanımı: /Dest veya /D ardından açık hedef dizisi yerine ad ya da dizgi
+_NAMED_DEST = re.compile(r"/D(?:est)?\s*(?:[(/]|<(?!<))")
+# Eylem anahtarları (/A, /OpenAction); türü ancak eylem nesnesi okununca belli olur
+_ACTION_KEY = re.compile(r"/(?:A|OpenAction)[\s<\d\[]")
+
+
+def cleanup_categories(options):
+    """Ayarlardan kaldırılacak nesne kategorilerini çıkar"""
+    categories = set(options["cleanup"])
+    unknown = categories - CLEANUP_CATEGORIES.keys()
+    if unknown:
+        raise ValueError(f"Bilinmeyen temizlik kategorisi: {', '.join(sorted(unknown))}")
+    if options["remove_annotations"]:
+        categories.add("annotations")
+    return categories
+
+
+def _annot_category(doc, xref, categories):
+    """Açıklamanın kaldırılacağı kategori; korunacaksa None"""
+    subtype = doc.xref_get_key(xref, "Subtype")[1]
+    if subtype == "/Widget":
+        category = "widgets"
+    elif subtype == "/Link":
+        category = "links"
+    elif subtype == "/FileAttachment" and "embedded_files" in categories:
+        category = "embedded_files"
+    else:
+        category = "annotations"
+    return category if category in categories else None
+
+
+def _drop_keys(doc, xref, keys):
+    """Anahtarları nesneden sil.
+
+    Akış sözlüğü akış kaybolmadan yeniden yazılamadığından orada anahtar null
+    bırakılır; PDF'te null değerli anahtar yok sayılır.
+    """
+    for key in keys:
+        doc.xref_set_key(xref, key, "null")
+    if not doc.xref_is_stream(xref):
+        names = "|".join(re.escape(key.rsplit("/", 1)[-1]) for key in keys)
+        text = doc.xref_object(xref, compressed=True)
+        doc.update_object(xref, re.sub(rf"/(?:{names}) null", "", text))
+
+
+def _free_object(doc, xref):
+    """Erişilemez hale gelen nesneyi boşalt.
+
+    "null" ile değiştirmek bellekteki belgede xref girdisini okunamaz bırakır
+    ve sonraki xref taramaları hata verir; boş sözlük ise nesne toplayan
+    profillerde kaydederken yine silinir.
+    """
+    if doc.xref_is_stream(xref):
+        doc.update_stream(xref, b"")
+    doc.update_object(xref, "<<>>")
+
+
+def cleanup_objects(doc, categories):
+    """Seçilen nesne kategorilerini xref tablosu üzerinde tek geçişte kaldır.
+
+    Sayfalar yüklenmez; /Annots dizileri ve sayfa/katalog anahtarları doğrudan
+    düzenlenir. Ardından katalogdan erişilemez hale gelen nesneler boşaltılır
+    (nesne toplamayan kaydetme profilinde de yer kazanılır) ve boyutları nesneye
+    ilk ulaşan kategoriye yazılır. {kategori: kazanılan bayt} döndürür.
+    """
+    roots = {category: [] for category in CLEANUP_CATEGORIES}  # koparılan başvurular
+    reclaimed = {category: 0 for category in CLEANUP_CATEGORIES}  # satır içi değerler
+    edges = {}
+    named_dest_used = False
+    
+    def detach(xref, candidates):
+        keys = []
+        for key, category in candidates:
+            if category not in categories:
+                continue
+            kind, value = doc.xref_get_key(xref, key)
+            if kind == "null":
+                continue
+            if kind == "xref":
+                roots[category].extend(_object_refs(value))
+            else:
+                reclaimed[category] += len(value)
+            keys.append(key)
+        if keys:
+            _drop_keys(doc, xref, keys)
+        return bool(keys)
+    
+    for xref in range(1, doc.xref_length()):
+        text = doc.xref_object(xref, compressed=True)
+        if not named_dest_used and _NAMED_DEST.search(text):
+            named_dest_used = True
+        changed = False
+        candidates = []
+        if "/Type/Page" in text and doc.xref_get_key(xref, "Type")[1] == "/Page":
+            candidates.append(("Thumb", "thumbnails"))
+            kind, value = doc.xref_get_key(xref, "Annots")
+            if kind == "xref":  # dolaylı dizi
+                value = doc.xref_object(_object_refs(value)[0], compressed=True)
+            refs = _object_refs(value) if kind != "null" else []
+            kept = []
+            for ref in refs:
+                category = _annot_category(doc, ref, categories)
+                if category:
+                    roots[category].append(ref)
+                else:
+                    kept.append(ref)
+            if len(kept) < len(refs):
+                changed = True
+                if kept:
+                    doc.xref_set_key(xref, "Annots", "[" + " ".join(f"{ref} 0 R" for ref in kept) + "]")
+                else:
+                    _drop_keys(doc, xref, ["Annots"])
+        if "/Metadata" in text:
+            candidates.append(("Metadata", "metadata"))
+        if "/AA" in text:
+            candidates.append(("AA", "javascript"))
+        if _ACTION_KEY.search(text):
+            candidates.extend((key, "javascript") for key in ("A", "OpenAction")
+                              if doc.xref_get_key(xref, f"{key}/S")[1] == "/JavaScript")
+        if detach(xref, candidates) or changed:
+            text = doc.xref_object(xref, compressed=True)
+        edges[xref] = _object_refs(text)
+    
+    # Katalog düzeyi: form, ad ağaçları ve (hiçbir yerden anılmıyorsa) adlı hedefler
+    catalog = doc.pdf_catalog()
+    names_kind, names_value = doc.xref_get_key(catalog, "Names")
+    names = (_object_refs(names_value)[0], "") if names_kind == "xref" else (catalog, "Names/")
+    catalog_keys = [("AcroForm", "widgets")]
+    name_keys = [(names[1] + "EmbeddedFiles", "embedded_files"),
+                 (names[1] + "JavaScript", "javascript")]
+    if not named_dest_used:
+        catalog_keys.append(("Dests", "named_dests"))
+        name_keys.append((names[1] + "Dests", "named_dests"))
+    for xref, candidates in ((catalog, catalog_keys), (names[0], name_keys)):
+        if detach(xref, candidates):
+            if doc.xref_get_key(catalog, "Names")[1] == "<<>>":
+                _drop_keys(doc, catalog, ["Names"])
+            edges[xref] = _object_refs(doc.xref_object(xref, compressed=True))
+    
+    # Hâlâ erişilebilen nesneler (paylaşılan font, görüntü vb.) korunur
+    reachable = set()
+    stack = _object_refs(doc.pdf_trailer(compressed=True))
+    while stack:
+        xref = stack.pop()
+        if xref in edges and xref not in reachable:
+            reachable.add(xref)
+            stack.extend(edges[xref])
+    freed = set()
+    for category in CLEANUP_CATEGORIES:
+        stack = list(roots[category])
+        while stack:
+            xref = stack.pop()
+            if xref not in edges or xref in reachable or xref in freed:
+                continue
+            freed.add(xref)
+            stack.extend(edges[xref])
+            reclaimed[category] += len(doc.xref_object(xref, compressed=True))
+            if doc.xref_is_stream(xref):
+                reclaimed[category] += _stream_length(doc, xref)
+            _free_object(doc, xref)
+    return {category: reclaimed[category] for category in CLEANUP_CATEGORIES
+            if category in categories}
+
+
+def _font_files(doc):
+    """Gömülü font programları: [(FontDescriptor xref, anahtar, program xref)]"""
+    found = []
+    for xref in range(1, doc.xref_length()):
+        if doc.xref_get_key(xref, "Type")[1] != "/FontDescriptor":
+            continue
+        for key in FONT_FILE_KEYS:
+            kind, value = doc.xref_get_key(xref, key)
+            if kind == "xref":
+                found.append((xref, key, int(value.split()[0])))
+    return found
+
+
+def optimize_fonts(doc, log):
+    """Özdeş gömülü font programlarını birleştirip fontları kullanılan gliflere indir.
+
+    Birleştirme akış baytlarının özetiyle yapılır; farklı kaynaklardan
+    birleştirilmiş belgelerde aynı font tek programa iner ve alt kümesi tüm
+    sayfalardaki gliflerden çıkarılır. Alt kümeleme MuPDF'in kendi işleviyle
+    yapılır, hata verirse ve fontTools kuruluysa PyMuPDF'in eski yoluna düşülür.
+    Artık kullanılmayan programlar boşaltılır.
+    {"before", "after", "deduplicated"} döndürür.
+    """
+    programs = _font_files(doc)
+    old = {program for _, _, program in programs}
+    before = sum(_stream_length(doc, program) for program in old)
+    canonical = {}
+    for descriptor, key, program in programs:
+        first = canonical.setdefault(hashlib.sha256(doc.xref_stream_raw(program)).digest(), program)
+        if first != program:
+            doc.xref_set_key(descriptor, key, f"{first} 0 R")
+    
+    try:
+        doc.subset_fonts()
+    except Exception as exc:  # MuPDF'in alt kümelemesi yeni; bazı fontlarda hata verebilir
+        error = exc
+        if fontTools is not None:
+            try:
+                doc.subset_fonts(fallback=True)
+                error = None
+            except Exception as fallback_exc:
+                error = fallback_exc
+        if error is not None:
+            log(f"⚠️ Font alt kümeleme atlandı ({error}), yalnızca birleştirme uygulandı")
+    
+    current = {program for _, _, program in _font_files(doc)}
+    for program in old - current:
+        _free_object(doc, program)
+    return {"before": before,
+            "after": sum(_stream_length(doc, program) for program in current),
+            "deduplicated": len(old) - len(current)}
+
+
+def save_options(options):
+    """`compression_level` profilinden `Document.save` parametrelerini üret"""
+    params = dict(SAVE_PROFILES[SAVE_LEVELS[options["compression_level"]]])
+    params.setdefault("deflate_fonts", options["compress_fonts"])
+    if options["object_streams"]:
+        params["use_objstms"] = 1
+    return params
+
+
+def _new_stats(options=None):
+    """Boş istatistik sözlüğü; `timing_report` açıksa sayfa bazında süreler de tutulur"""
+    detailed = bool(options and options["timing_report"])
+    return {"pages": 0, "images_recompressed": 0, "image_bytes_saved": 0,
+            "images_deduplicated": 0, "image_cache_hits": 0,
+            "pages_copy": 0, "pages_images": 0, "pages_raster": 0, "pages_text": 0,
+            "pages_fallback": 0, "images_gray": 0, "images_bilevel": 0, "page_colors": [],
+            "stages": {}, "page_stages": [] if detailed else None}
+
+
+def _add_stats(total, part):
+    for key in total:
+        if key == "stages":
+            for name, record in part["stages"].items():
+                _add_stage(total, name, record)
+        elif key == "page_stages":
+            if total["page_stages"] is not None and part["page_stages"]:
+                total["page_stages"].extend(part["page_stages"])
+        else:
+            total[key] += part[key]
+
+
+def _add_stage(stats, name, record):
+    total = stats["stages"].setdefault(name, {"calls": 0, "wall": 0.0, "cpu": 0.0, "bytes": 0})
+    for key in total:
+        total[key] += record[key]
+
+
+@contextmanager
+def _stage(stats, name, page_num=None):
+    """Bir işlem aşamasının duvar/CPU süresini ve baytlarını `stats`'a ekle.
+
+    Blok içinde `record["bytes"]` ayarlanabilir. Alt aşamalar "images/encode"
+    gibi eğik çizgiyle adlandırılır; toplam süreye yalnızca üst aşamalar girer.
+    `stats` None ise hiçbir şey kaydedilmez.
+    """
+    record = {"calls": 1, "wall": 0.0, "cpu": 0.0, "bytes": 0}
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+    try:
+        yield record
+    finally:
+        if stats is not None:
+            record["wall"] = time.perf_counter() - wall
+            record["cpu"] = time.thread_time() - cpu
+            _add_stage(stats, name, record)
+            if page_num is not None and stats["page_stages"] is not None:
+                stats["page_stages"].append({"page": page_num + 1, "stage": name, **record})
+
+
+def _current_rss():
+    """Sürecin anlık bellek kullanımını bayt olarak döndür, ölçülemezse 0"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _render_page(page, options, stats=None):
+    """Sayfayı doğrudan hedef çözünürlükte (gerekirse üst örneklemeyle) render et.
+
+    (görüntü, pixmap, renk sınıfı) döndürür. Görüntü pixmap belleğini
+    kopyalamadan kullanır; pixmap, görüntü bırakılana kadar tutulmalı ve
+    MuPDF iş parçacığı güvenli olmadığından ana iş parçacığında bırakılmalıdır.
+    Gri algılama açıksa renk düşük çözünürlüklü bir ön render'da kontrol
+    edilir, gri sayfalar doğrudan gri renk uzayında render edilir; siyah-beyaz
+    sayfalar en az BILEVEL_DPI'da yeniden render edilir.
+    """
+    supersample = options["supersample"]
+    page_num = page.number
+    color = "color"
+    colorspace = fitz.csRGB
+    if options["gray_detect"]:
+        with _stage(stats, "detect", page_num):
+            probe = page.get_pixmap(dpi=COLOR_PROBE_DPI)
+            # Küçük ön render kopyalanır ki pixmap bellek görünümü dışa açık kalmasın
+            if _is_grayscale(Image.frombytes("RGB", (probe.width, probe.height), probe.samples)):
+                color, colorspace = "gray", fitz.csGRAY
+    
+    mat, target_size = _render_matrix(page.rect, options["dpi"], options["max_image_size"],
+                                      supersample)
+    with _stage(stats, "render", page_num) as record:
+        pix = page.get_pixmap(matrix=mat, colorspace=colorspace)
+        record["bytes"] = len(pix.samples_mv)
+    
+    if supersample > 1:
+        # Üst örneklenmiş pixmap'i hedef boyuta küçült
+        with _stage(stats, "resize", page_num):
+            img = _pixmap_to_image(pix)
+            img = img.resize(target_size, Image.Resampling.LANCZOS)
+    else:
+        img = _pixmap_to_image(pix)
+    
+    if color == "gray":
+        with _stage(stats, "detect", page_num):
+            if _is_bilevel(img):
+                color = "bilevel"
+        if color == "bilevel" and options["dpi"] < BILEVEL_DPI:
+            mat, target_size = _render_matrix(page.rect, BILEVEL_DPI, options["max_image_size"])
+            del img  # eski pixmap'in örnekleri serbest kalsın
+            with _stage(stats, "render", page_num) as record:
+                pix = page.get_pixmap(matrix=mat, colorspace=colorspace)
+                record["bytes"] = len(pix.samples_mv)
+            img = _pixmap_to_image(pix)
+    return img, pix, color
+
+
+def _encode_page(img, options, color, page_num, stats=None, stage="encode"):
+    """Render edilmiş sayfayı seçili kodlayıcıyla kodla; (veri, filtre, boyut) döndürür.
+
+    Yalnızca Pillow kullanır, kodlama sırasında GIL bırakıldığından iş
+    parçacığı havuzunda çalışabilir. MuPDF'in kendi JPEG çıktısı PIL'den
+    belirgin yavaştır.
+    """
+    with _stage(stats, stage, page_num) as record:
+        img_data, image_filter = _encode_image(img, options, color=color)
+        record["bytes"] = len(img_data)
+    return img_data, image_filter, img.size
+
+
+def _encode_page_job(image_box, options, color, page_num):
+    """İş parçacığında kodla; süreler ayrı bir istatistik sözlüğünde döner.
+
+    Görüntü tek elemanlı listede gelir ve burada çıkarılır; böylece iş bitince
+    ona başka referans kalmaz ve pixmap güvenle bırakılabilir. İş parçacıkları
+    eşzamanlı çalıştığından süreleri toplam süreye girmeyen "encode/threads"
+    alt aşamasına yazılır; "encode" ana iş parçacığının bekleme süresidir.
+    """
+    img = image_box.pop()
+    stats = _new_stats(options)
+    return (*_encode_page(img, options, color, page_num, stats, "encode/threads"), stats)
+
+
+def _render_page_image(page, options, stats=None):
+    """Sayfayı render edip kodla: (veri, PDF filtresi, (genişlik, yükseklik), renk sınıfı)"""
+    img, pix, color = _render_page(page, options, stats)
+    img_data, image_filter, size = _encode_page(img, options, color, page.number, stats)
+    # Gri pixmap'ler PIL'e kopyalanmadan eşlenir; pixmap'ten önce görüntü bırakılmalı
+    del img
+    del pix
+    return img_data, image_filter, size, color
+
+
+def _classify_page(page):
+    """Ucuz sinyallerle sayfa stratejisi seç: "copy", "images" veya "raster".
+
+    Sinyaller render etmeden tek geçişte toplanır: görüntülerin sayfayı
+    kaplama oranı, metin parçası sayısı (OCR katmanındaki görünmez metin de
+    dahil) ve içerik akışı boyutu.
+    """
+    images = text_spans = 0
+    image_area = 0.0
+    for kind, rect in page.get_bboxlog():
+        if "image" in kind or kind == "fill-imgmask":
+            images += 1
+            image_area += abs(fitz.Rect(rect) & page.rect)
+        elif "text" in kind:
+            text_spans += 1
+    page_area = abs(page.rect) or 1
+    coverage = min(1.0, image_area / page_area)
+    content_bytes = sum(len(page.parent.xref_stream_raw(xref)) for xref in page.get_contents())
+    
+    if images == 0:
+        # Vektör sayfa: çok ağır çizimler dışında olduğu gibi kopyala
+        if content_bytes > AUTO_RASTER_CONTENT_BYTES and text_spans < AUTO_RASTER_MAX_SPANS:
+            return "raster"
+        return "copy"
+    if (coverage >= AUTO_RASTER_COVERAGE and images >= AUTO_RASTER_MIN_IMAGES
+            and text_spans < AUTO_RASTER_MAX_SPANS):
+        # Parçalı taramalar gibi çok görüntülü, metinsiz sayfalar
+        return "raster"
+    return "images"
+
+
+def _page_cost(page):
+    """Sayfanın kaynak belgedeki yaklaşık bayt maliyeti (içerik + görüntüler)"""
+    doc = page.parent
+    cost = sum(len(doc.xref_stream_raw(xref)) for xref in page.get_contents())
+    for xref in {item[0] for item in page.get_images()}:
+        cost += len(doc.xref_stream_raw(xref))
+    return cost
+
+
+def _strip_page_images(page):
+    """Sayfadaki görüntü XObject'lerini ve satır içi görüntüleri içerik akışından kaldır.
+
+    Tüm sayfayı kaplayan dolgusuz bir karartma uygulanır: yalnızca görüntüler
+    silinir, metin ve vektör çizimler dokunulmadan kalır. Karartma kapsadığı
+    bağlantıları da sildiğinden bağlantılar önceden alınıp yeniden eklenir.
+    Sahipsiz kalan görüntü nesneleri kaydederken çöp toplamayla atılır.
+    """
+    if not page.get_images() and not any(kind == "fill-image" for kind, _ in page.get_bboxlog()):
+        return
+    links = page.get_links()
+    page.add_redact_annot(page.rect, fill=False, cross_out=False)
+    page.apply_redactions(images=fitz.PDF_REDACT_IMAGE_REMOVE,
+                          graphics=fitz.PDF_REDACT_LINE_ART_NONE,
+                          text=fitz.PDF_REDACT_TEXT_NONE)
+    kept = {link["xref"] for link in page.get_links()}
+    for link in links:
+        if link["xref"] not in kept:
+            page.insert_link(link)
+
+
+class CompressionCancelled(Exception):
+    """İş, kullanıcı isteğiyle sayfalar arasında durduruldu"""
+
+
+class JobControl:
+    """Toplu iş için işbirlikçi iptal ve duraklatma bayrakları.
+
+    Olaylar spawn bağlamında oluşturulur; böylece havuz başlatıcısıyla işçi
+    süreçlere de aktarılabilir. Bayraklar her sayfadan önce kontrol edilir.
+    """
+
+    def __init__(self):
+        ctx = multiprocessing.get_context("spawn")
+        self._cancelled = ctx.Event()
+        self._running = ctx.Event()
+        self._running.set()
+
+    def cancel(self):
+        self._cancelled.set()
+        self._running.set()  # Duraklatılmış işçiler de uyanıp dursun
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def check(self):
+        """Duraklatılmışsa devam edilene kadar bekle, iptal edildiyse dur"""
+        self._running.wait()
+        if self._cancelled.is_set():
+            raise CompressionCancelled("İşlem iptal edildi")
+
+
+# Geçerli sürecin toplu işine ait kontrol (yoksa iptal/duraklatma yok)
+_job_control = None
+
+
+def _check_control():
+    if _job_control is not None:
+        _job_control.check()
+
+
+def _compress_pages(doc, new_doc, start, stop, options, on_page=None):
+    """`doc` içindeki [start, stop) sayfa aralığını işleyip `new_doc`'a ekler.
+
+    İstatistik sözlüğü döndürür. `on_page` doğru bir değer döndürürse işlem o
+    sayfadan sonra durur; işlenen sayfa sayısı `stats["pages"]` içindedir.
+
+    Olduğu gibi kopyalanan ardışık sayfalar biriktirilip tek `insert_pdf`
+    çağrısıyla aktarılır; böylece nesne grafiği her sayfa için yeniden
+    dolaşılmaz ve ortak kaynaklar bir kez eşlenir.
+
+    `encode_threads` > 0 ise raster sayfalar boru hattında işlenir: ana iş
+    parçacığı render eder, kodlama iş parçacığı havuzunda yapılır, sonuçlar
+    yine ana iş parçacığında sayfa sırasıyla birleştirilir. Bekleyen sayfa
+    sayısı iş parçacığı sayısının iki katıyla sınırlıdır.
+    """
+    quality = options["quality"]
+    remove_images = options["remove_images"]
+    adaptive = options["mode"] == "auto"
+    stats = _new_stats(options)
+    image_state = {"aliases": {}, "by_digest": {}, "placements": {}}
+    if options["mode"] in ("images", "auto") and not remove_images:
+        with _stage(stats, "placements"):
+            image_state["placements"] = _image_placements(doc, start, stop)
+    pending = []  # kopyalanmayı bekleyen ardışık sayfalar: (sayfa no, kopya sonrası işlem)
+    in_flight = deque()  # sırayla birleştirilmeyi bekleyen sayfalar
+    threads = options["encode_threads"]
+    encoder_pool = ThreadPoolExecutor(max_workers=threads) if threads > 0 else None
+
+    def flush_pending():
+        if not pending:
+            return
+        base = len(new_doc)
+        with _stage(stats, "copy"):
+            new_doc.insert_pdf(doc, from_page=pending[0][0], to_page=pending[-1][0])
+        for offset, (page_num, page_mode) in enumerate(pending):
+            if page_mode == "images":
+                with _stage(stats, "images", page_num) as record:
+                    saved = stats["image_bytes_saved"]
+                    _recompress_page_images(new_doc[base + offset], options, image_state, stats)
+                    record["bytes"] = stats["image_bytes_saved"] - saved
+            elif page_mode == "text":
+                with _stage(stats, "strip", page_num):
+                    _strip_page_images(new_doc[base + offset])
+        pending.clear()
+
+    def assemble(entry):
+        page_num, page_mode = entry["page"], entry["mode"]
+        if page_mode != "raster":
+            pending.append((page_num, page_mode))
+            return
+        if "job" in entry:
+            with _stage(stats, "encode", page_num):
+                img_data, image_filter, image_size, job_stats = entry["job"].result()
+            _add_stats(stats, job_stats)
+            # Kodlama bitti, görüntü bırakıldı; pixmap ana iş parçacığında serbest kalır
+            del entry["pix"]
+        else:
+            img_data, image_filter, image_size = entry["encoded"]
+        
+        if adaptive and len(img_data) >= entry["cost"]:
+            # Rasterleştirme sayfayı büyütecekse orijinali koru
+            pending.append((page_num, "copy"))
+            stats["pages_fallback"] += 1
+        else:
+            # Yeni sayfa oluştur ve görüntüyü doğrudan bellekten ekle
+            flush_pending()
+            rect = entry["rect"]
+            with _stage(stats, "insert_image", page_num) as record:
+                new_page = new_doc.new_page(width=rect.width, height=rect.height)
+                _insert_image_data(new_page, rect, img_data, image_filter, image_size)
+                record["bytes"] = len(img_data)
+            if options["gray_detect"]:
+                stats["page_colors"].append((page_num + 1, entry["color"]))
+        
+        # Bellek temizliği yap (akışlı modda parça boşaltmaları bunu üstlenir)
+        del img_data
+        if not options["streaming"]:
+            gc.collect()
+
+    def assemble_ready(limit):
+        # Baştaki sayfa hazırsa ya da sınır aşıldıysa (bekleyerek) sırayla birleştir
+        while in_flight and ("job" not in in_flight[0] or in_flight[0]["job"].done()
+                             or len(in_flight) > limit):
+            assemble(in_flight.popleft())
+
+    try:
+        for page_num in range(start, stop):
+            _check_control()
+            page = doc.load_page(page_num)
+            
+            if remove_images:
+                page_mode = "text"
+            elif adaptive:
+                with _stage(stats, "classify", page_num):
+                    page_mode = _classify_page(page)
+            elif options["mode"] == "images":
+                page_mode = "images"
+            else:
+                page_mode = "raster" if quality < 100 else "copy"
+            
+            # "images": sayfayı vektör olarak kopyala, sadece gömülü görüntüleri sıkıştır;
+            # "text": kopyala, görüntüleri çıkar; "copy": olduğu gibi kopyala
+            entry = {"page": page_num, "mode": page_mode}
+            if page_mode == "raster":
+                img, pix, color = _render_page(page, options, stats)
+                entry.update(rect=page.rect, color=color,
+                             cost=_page_cost(page) if adaptive else 0)
+                if encoder_pool is not None:
+                    # Görüntü kutu içinde verilir ki iş bitince iş parçacığında bırakılsın
+                    entry["job"] = encoder_pool.submit(_encode_page_job, [img], options, color, page_num)
+                    entry["pix"] = pix
+                else:
+                    entry["encoded"] = _encode_page(img, options, color, page_num, stats)
+                # Gri pixmap'ler PIL'e kopyalanmadan eşlenir; pixmap'ten önce görüntü bırakılmalı
+                del img
+                del pix
+            in_flight.append(entry)
+            assemble_ready(2 * threads)
+            
+            stats[f"pages_{page_mode}"] += 1
+            stats["pages"] += 1
+            if on_page is not None and on_page(page_num):
+                break
+        
+        assemble_ready(0)
+    finally:
+        if encoder_pool is not None:
+            encoder_pool.shutdown(cancel_futures=True)
+    flush_pending()
+    return stats
+
+
+def _compress_shard_worker(file_path, start, stop, shard_path, options):
+    """İşçi süreçte kendi fitz belgesini açıp bir sayfa aralığını sıkıştırır"""
+    doc = fitz.open(file_path)
+    shard_doc = fitz.open()
+    stats = _compress_pages(doc, shard_doc, start, stop, options)
+    with _stage(stats, "chunk_save") as record:
+        shard_doc.save(shard_path, **SAVE_PROFILES["fast"])
+        record["bytes"] = os.path.getsize(shard_path)
+    shard_doc.close()
+    doc.close()
+    return shard_path, stats
+
+
+def _compress_sharded(file_path, new_doc, total_pages, options, page_pool, log, progress):
+    """Sayfaları aralıklara bölüp işçi süreçlerde işler, sonuçları sırayla birleştirir"""
+    workers = options["workers"]
+    shard_pages = max(MIN_SHARD_PAGES, math.ceil(total_pages / (workers * SHARDS_PER_WORKER)))
+    ranges = [(start, min(start + shard_pages, total_pages))
+              for start in range(0, total_pages, shard_pages)]
+    log(f"Sayfa aralıklarına bölündü: {len(ranges)} parça, {workers} işçi")
+
+    shard_dir = tempfile.mkdtemp(prefix="pdf_shards_")
+    try:
+        futures = {
+            page_pool.submit(_compress_shard_worker, file_path, start, stop,
+                             os.path.join(shard_dir, f"shard_{n:05d}.pdf"), options): n
+            for n, (start, stop) in enumerate(ranges)
+        }
+        shard_paths = [None] * len(ranges)
+        stats = _new_stats(options)
+        done_pages = 0
+        for future in as_completed(futures):
+            n = futures[future]
+            shard_paths[n], shard_stats = future.result()
+            _add_stats(stats, shard_stats)
+            start, stop = ranges[n]
+            done_pages += stop - start
+            progress(done_pages, total_pages)
+
+        # Parçaları sayfa sırasıyla birleştir
+        with _stage(stats, "merge"):
+            for shard_path in shard_paths:
+                shard_doc = fitz.open(shard_path)
+                new_doc.insert_pdf(shard_doc)
+                shard_doc.close()
+    finally:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+    return stats
+
+
+def _compress_streaming(doc, total_pages, options, log, progress, chunk_dir, resume=False):
+    """Sayfaları parçalar halinde işleyip her parçayı diske boşaltır.
+
+    Bir parça `chunk_pages` sayfaya ulaştığında ya da süreç belleği
+    `memory_limit_mb` sınırını aştığında kaydedilip kapatılır ve MuPDF
+    önbelleği küçültülür. Sınır aşılmaya devam ederse parça boyu yarıya
+    indirilir. Sonda parçalar `chunk_dir` içindeki tek bir dosyaya artımlı
+    kaydedilerek birleştirilir; bellekte her seferinde yalnızca bir parça
+    tutulur. (istatistikler, birleşik belge) döner; belge diskteki dosyadan
+    okunduğundan çağıran onu kapatıp `chunk_dir`'i siler.
+
+    `resume` açıksa parçalar `chunk_dir`'de kalıcı tutulur ve her parçadan
+    sonra durum dosyası güncellenir; yarıda kalan iş son boşaltılan parçadan
+    devam eder.
+    """
+    chunk_pages = max(1, options["chunk_pages"])
+    memory_limit = options["memory_limit_mb"] * 1024 * 1024
+    stats = _new_stats(options)
+    peak_rss = _current_rss()
+    chunks = []  # boşaltılan parçalar: {"file", "start", "stop", "stats"}
+    os.makedirs(chunk_dir, exist_ok=True)
+    if resume:
+        chunks = _load_chunk_state(chunk_dir)
+        for chunk in chunks:
+            _add_stats(stats, chunk["stats"])
+
+    def on_page(page_num):
+        nonlocal peak_rss
+        progress(page_num + 1, total_pages)
+        rss = _current_rss()
+        peak_rss = max(peak_rss, rss)
+        return memory_limit and rss > memory_limit
+
+    try:
+        start = chunks[-1]["stop"] if chunks else 0
+        if start:
+            log(f"⏯ Kaldığı yerden devam ediliyor: sayfa {start + 1}/{total_pages} "
+                f"({len(chunks)} parça hazır)")
+            progress(start, total_pages)
+        while start < total_pages:
+            chunk_doc = fitz.open()
+            chunk_stats = _compress_pages(doc, chunk_doc, start, min(start + chunk_pages, total_pages),
+                                          options, on_page)
+            _add_stats(stats, chunk_stats)
+            chunk_name = f"chunk_{len(chunks):05d}.pdf"
+            chunk_path = os.path.join(chunk_dir, chunk_name)
+            with _stage(stats, "chunk_save") as record:
+                chunk_doc.save(chunk_path, **SAVE_PROFILES["fast"])
+                record["bytes"] = os.path.getsize(chunk_path)
+            chunk_doc.close()
+            stop = start + chunk_stats["pages"]
+            chunks.append({"file": chunk_name, "start": start, "stop": stop, "stats": chunk_stats})
+            if resume:
+                _save_chunk_state(chunk_dir, chunks)
+            start = stop
+            
+            # Parça kapandıktan sonra MuPDF önbelleğini ve Python nesnelerini boşalt
+            fitz.TOOLS.store_shrink(100)
+            gc.collect()
+            if memory_limit and _current_rss() > memory_limit and chunk_pages > 1:
+                chunk_pages = max(1, chunk_pages // 2)
+                log(f"⚠️ Bellek sınırı aşıldı, parça boyu {chunk_pages} sayfaya düşürüldü")
+
+        # Parçaları sırayla birleşik dosyaya ekle. Her parçadan sonra yalnızca yeni
+        # nesneler artımlı kaydedilip belge kapatılır; böylece bellek büyümez
+        with _stage(stats, "merge"):
+            if not chunks:
+                merged = fitz.open()
+            else:
+                merged_path = os.path.join(chunk_dir, MERGED_FILE)
+                shutil.copyfile(os.path.join(chunk_dir, chunks[0]["file"]), merged_path)
+                for chunk in chunks[1:]:
+                    merged = fitz.open(merged_path)
+                    chunk_doc = fitz.open(os.path.join(chunk_dir, chunk["file"]))
+                    merged.insert_pdf(chunk_doc)
+                    chunk_doc.close()
+                    merged.saveIncr()
+                    merged.close()
+                    fitz.TOOLS.store_shrink(100)
+                merged = fitz.open(merged_path)
+    except BaseException:
+        if not resume:
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+        raise
+
+    peak_rss = max(peak_rss, _current_rss())
+    log(f"Akışlı işlem: {len(chunks)} parça diske boşaltıldı")
+    if peak_rss:
+        log(f"Bellek tepe değeri: {format_size(peak_rss)}")
+    return stats, merged
+
+
+CHUNK_STATE_FILE = "state.json"
+# Akışlı işlemde parçaların artımlı birleştirildiği dosya
+MERGED_FILE = "merged.pdf"
+
+
+def _load_chunk_state(parts_dir):
+    """Önceki çalışmadan kalan, dosyası hâlâ duran parçaları oku"""
+    try:
+        with open(os.path.join(parts_dir, CHUNK_STATE_FILE), encoding="utf-8") as f:
+            chunks = json.load(f)["chunks"]
+    except (OSError, ValueError, KeyError):
+        return []
+    valid = []
+    for chunk in chunks:
+        # Parçalar sıralı olmalı; eksik bir dosyadan sonrası kullanılamaz
+        if chunk["start"] != (valid[-1]["stop"] if valid else 0):
+            break
+        if not os.path.exists(os.path.join(parts_dir, chunk["file"])):
+            break
+        chunk["stats"]["page_colors"] = [tuple(item) for item in chunk["stats"]["page_colors"]]
+        valid.append(chunk)
+    return valid
+
+
+def _save_chunk_state(parts_dir, chunks):
+    """Parça listesini geçici dosya üzerinden atomik olarak yaz"""
+    fd, tmp_path = tempfile.mkstemp(prefix=".state_", suffix=".json", dir=parts_dir)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"chunks": chunks}, f, ensure_ascii=False)
+    os.replace(tmp_path, os.path.join(parts_dir, CHUNK_STATE_FILE))
+
+
+def compress_file(file_path, output_folder, options, log, progress, page_pool=None):
+    """Tek bir PDF dosyasını sıkıştırır.
+
+    `log(mesaj)` ve `progress(islenen_sayfa, toplam_sayfa)` geri çağrıları
+    hem QThread içinde hem de işçi süreçlerinde kullanılabilir. `page_pool`
+    verilirse ve `split_pages` açıksa sayfalar işçi süreçlere dağıtılır.
+    `profile_dir` verilirse işlem cProfile altında çalışır ve sonuç
+    `<ad>.prof` olarak o klasöre yazılır.
+    """
+    if not options["profile_dir"]:
+        return _compress_file(file_path, output_folder, options, log, progress, page_pool)
+    
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(_compress_file, file_path, output_folder, options, log,
+                                progress, page_pool)
+    finally:
+        os.makedirs(options["profile_dir"], exist_ok=True)
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        profile_path = os.path.join(options["profile_dir"], f"{base_name}.prof")
+        profiler.dump_stats(profile_path)
+        log(f"Profil kaydedildi: {profile_path}")
+
+
+def _compress_file(file_path, output_folder, options, log, progress, page_pool):
+    started = time.perf_counter()
+    compression_level = options["compression_level"]
+
+    log(f"İşleniyor: {os.path.basename(file_path)}")
+    
+    # Çıktı dosya yolu (klasör verilmezse girdinin yanına yazılır)
+    if not output_folder:
+        output_folder = os.path.dirname(os.path.abspath(file_path))
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    output_path = os.path.join(output_folder, f"{base_name}_compressed.pdf")
+    
+    # Girdi ve ayarlar değişmediyse önceki sonucu kullan
+    cache_key = None
+    if options["result_cache"]:
+        cache_key = result_cache_key(_file_digest(file_path), options)
+        cached = _cached_result(options["result_cache"], cache_key, file_path, output_path, log)
+        if cached is not None:
+            return cached
+    
+    # Kontrol noktası: önceki çalışmada bitmiş dosyayı atla, yarım kalanın parçalarını kullan
+    checkpoint_key = parts_dir = chunk_dir = None
+    if options["checkpoint"]:
+        checkpoint_key = _checkpoint_key(file_path, options)
+        finished = _cached_result(options["checkpoint"], checkpoint_key, file_path, output_path, log)
+        if finished is not None:
+            return {**finished, "cache_key": cache_key, "checkpoint_key": checkpoint_key}
+        if options["streaming"]:
+            parts_dir = _checkpoint_parts_dir(options["checkpoint"], checkpoint_key)
+    
+    # Büyük dosyalar için özel işlem
+    file_size = os.path.getsize(file_path)
+    log(f"Dosya boyutu: {format_size(file_size)}")
+    
+    if file_size > 50 * 1024 * 1024:  # 50MB+
+        log("Büyük dosya tespit edildi, özel sıkıştırma uygulanıyor...")
+    
+    # PDF'yi yükle
+    file_stats = _new_stats(options)
+    with _stage(file_stats, "open") as record:
+        doc = fitz.open(file_path)
+        record["bytes"] = file_size
+    log(f"Toplam sayfa sayısı: {len(doc)}")
+    
+    # Yeni PDF oluştur
+    new_doc = fitz.open()
+    
+    total_pages = len(doc)
+    preflight = None
+    if options["preflight"] or options["min_savings"]:
+        options, preflight, skip_reason = _preflight(doc, file_size, options, log, file_stats)
+        if skip_reason:
+            doc.close()
+            new_doc.close()
+            return _keep_original(file_path, output_path, total_pages, file_stats, preflight,
+                                  cache_key, checkpoint_key, started, log,
+                                  f"⏭ Atlandı ({skip_reason})", options)
+    
+    if options["target_size_mb"] and not options["remove_images"]:
+        with _stage(file_stats, "target_search"):
+            options = {**options, **_find_target_settings(doc, file_size, options, log)}
+    
+    if (page_pool is not None and options["split_pages"]
+            and total_pages >= 2 * MIN_SHARD_PAGES):
+        stats = _compress_sharded(file_path, new_doc, total_pages, options, page_pool, log, progress)
+    elif options["streaming"]:
+        # Birleşik belge parça klasöründeki dosyadan okunur; klasör kaydetmeden sonra silinir
+        new_doc.close()
+        chunk_dir = parts_dir or tempfile.mkdtemp(prefix="pdf_chunks_")
+        stats, new_doc = _compress_streaming(doc, total_pages, options, log, progress,
+                                             chunk_dir, resume=bool(parts_dir))
+    else:
+        stats = _compress_pages(doc, new_doc, 0, total_pages, options,
+                                lambda page_num: progress(page_num + 1, total_pages))
+    _add_stats(stats, file_stats)
+    
+    if options["mode"] == "auto" and not options["remove_images"]:
+        log(f"Sayfa stratejisi: {stats['pages_copy']} kopya, {stats['pages_images']} görüntü, "
+            f"{stats['pages_raster']} raster ({stats['pages_fallback']} sayfa orijinale döndü)")
+    if options["gray_detect"] and stats["page_colors"]:
+        by_color = {}
+        for page_number, color in sorted(stats["page_colors"]):
+            by_color.setdefault(color, []).append(page_number)
+        log("Renk algılama: " + ", ".join(f"{len(by_color.get(color, []))} {label}"
+                                          for color, label in COLOR_LABELS.items()))
+        for color, label in COLOR_LABELS.items():
+            if color in by_color:
+                log(f"  {label}: sayfa {_page_ranges(by_color[color])}")
+    if options["mode"] in ("images", "auto") and not options["remove_images"]:
+        log(f"Yeniden sıkıştırılan görüntü: {stats['images_recompressed']} "
+            f"({format_size(stats['image_bytes_saved'])} kazanç), "
+            f"tekilleştirilen: {stats['images_deduplicated']}, "
+            f"önbellek isabeti: {stats['image_cache_hits']}"
+            + (f", gri: {stats['images_gray']}, siyah-beyaz: {stats['images_bilevel']}"
+               if options["gray_detect"] else ""))
+    
+    # Açıklama, form, ek, üst veri vb. nesneleri tek xref geçişinde kaldır
+    cleanup = {}
+    categories = cleanup_categories(options)
+    if categories:
+        cleanup = _run_cleanup(new_doc, categories, stats, log)
+    
+    # Çıktıya vektör olarak kopyalanan sayfa varsa (mod adından bağımsız olarak;
+    # ör. kalite 100'de raster de kopyalar) kaynak fontları birleştir ve alt kümele
+    fonts = None
+    copied_pages = sum(stats[key] for key in ("pages_copy", "pages_images", "pages_text", "pages_fallback"))
+    if options["optimize_fonts"] and copied_pages:
+        with _stage(stats, "fonts") as record:
+            fonts = optimize_fonts(new_doc, log)
+            record["bytes"] = fonts["before"] - fonts["after"]
+        if fonts["before"]:
+            log(f"Fontlar: {format_size(fonts['before'])} -> {format_size(fonts['after'])} "
+                f"({fonts['deduplicated']} program birleştirildi)")
+    
+    # PDF'yi kaydet - Sıkıştırma seviyesine göre. Önce geçici dosyaya yazılır;
+    # çıktı orijinalden küçük değilse orijinal aynen kopyalanır
+    profile = SAVE_LEVELS[compression_level]
+    partial_path = f"{output_path}.part"
+    with _stage(stats, "save") as record:
+        new_doc.save(partial_path, **save_options(options))
+        record["bytes"] = os.path.getsize(partial_path)
+    log(f"Kaydetme ({profile} profili): {record['wall']:.2f} sn")
+    
+    # Dosyaları kapat
+    doc.close()
+    new_doc.close()
+    if chunk_dir:
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+    if parts_dir:
+        try:
+            os.rmdir(os.path.dirname(parts_dir))  # Yarım kalan başka dosya yoksa
+        except OSError:
+            pass
+    
+    # Bellek temizliği
+    gc.collect()
+    
+    # Boyut karşılaştırması
+    original_size = os.path.getsize(file_path)
+    content_changed = options["remove_images"] or any(cleanup.values())
+    if record["bytes"] >= original_size and not content_changed:
+        os.remove(partial_path)
+        return _keep_original(file_path, output_path, total_pages, stats, preflight,
+                              cache_key, checkpoint_key, started, log,
+                              f"⚠️ Çıktı orijinalden küçük değil ({format_size(record['bytes'])})",
+                              options)
+    os.replace(partial_path, output_path)
+    compressed_size = os.path.getsize(output_path)
+    reduction = (1 - compressed_size / original_size) * 100
+    
+    log(f"✓ Tamamlandı: {os.path.basename(file_path)}")
+    log(f"  Orijinal boyut: {format_size(original_size)}")
+    log(f"  Sıkıştırılmış boyut: {format_size(compressed_size)}")
+    log(f"  Boyut azalması: {reduction:.1f}%")
+    if options["target_size_mb"] and compressed_size > options["target_size_mb"] * 1024 * 1024:
+        log(f"  ⚠️ Çıktı hedef boyutu ({options['target_size_mb']} MB) aştı")
+    seconds = time.perf_counter() - started
+    if options["timing_summary"]:
+        for line in format_stage_summary(stats, seconds):
+            log(line)
+    log("-" * 60)
+
+    return {
+        "file": file_path,
+        "output": output_path,
+        "pages": total_pages,
+        "original_size": original_size,
+        "compressed_size": compressed_size,
+        "reduction": round(reduction, 2),
+        "seconds": round(seconds, 3),
+        "stats": stats,
+        "cached": False,
+        "kept_original": False,
+        "preflight": preflight,
+        "cleanup": cleanup,
+        "fonts": fonts,
+        "cache_key": cache_key,
+        "checkpoint_key": checkpoint_key,
+    }
+
+
+def _run_cleanup(doc, categories, stats, log):
+    """Temizliği çalıştırıp kategori bazında kazancı günlüğe yaz"""
+    with _stage(stats, "cleanup") as record:
+        cleanup = cleanup_objects(doc, categories)
+        record["bytes"] = sum(cleanup.values())
+    # Belgede bulunmayan kategoriler (ör. insert_pdf'in zaten taşımadığı katalog girdileri) yazılmaz
+    removed = [f"{CLEANUP_CATEGORIES[category]} {format_size(size)}"
+               for category, size in cleanup.items() if size]
+    log("Temizlik: " + (", ".join(removed) if removed else "kaldırılacak nesne bulunamadı"))
+    return cleanup
+
+
+def _keep_original(file_path, output_path, total_pages, stats, preflight, cache_key,
+                   checkpoint_key, started, log, message, options):
+    """Sıkıştırma kazanç getirmediğinde orijinali çıktı olarak (atomik) yaz.
+
+    Temizlik kategorileri istendiyse orijinal aynen kopyalanmaz; temizlik
+    orijinalin kendisinde çalıştırılıp sonuç kaydedilir. Sıkıştırılmış belgede
+    `insert_pdf`'in taşımadığı katalog girdileri (JavaScript, gömülü dosyalar,
+    XMP) orijinalde durduğundan temizliğin bulacağı nesneler buradadır.
+    """
+    partial_path = f"{output_path}.part"
+    cleanup = {}
+    categories = cleanup_categories(options)
+    if categories:
+        with fitz.open(file_path) as doc:
+            cleanup = _run_cleanup(doc, categories, stats, log)
+            with _stage(stats, "save"):
+                doc.save(partial_path, **save_options(options))
+        message += ", orijinal temizlenerek yazıldı"
+    else:
+        shutil.copyfile(file_path, partial_path)
+        message += ", orijinal aynen yazıldı"
+    os.replace(partial_path, output_path)
+    original_size = os.path.getsize(file_path)
+    compressed_size = os.path.getsize(output_path)
+    log(message)
+    log(f"✓ Tamamlandı: {os.path.basename(file_path)}")
+    log("-" * 60)
+    return {
+        "file": file_path,
+        "output": output_path,
+        "pages": total_pages,
+        "original_size": original_size,
+        "compressed_size": compressed_size,
+        "reduction": round((1 - compressed_size / original_size) * 100, 2),
+        "seconds": round(time.perf_counter() - started, 3),
+        "stats": stats,
+        "cached": False,
+        "kept_original": True,
+        "preflight": preflight,
+        "cleanup": cleanup,
+        "fonts": None,
+        "cache_key": cache_key,
+        "checkpoint_key": checkpoint_key,
+    }
+
+
+COLOR_LABELS = {"color": "renkli", "gray": "gri", "bilevel": "siyah-beyaz"}
+
+
+def _page_ranges(pages):
+    """[1, 2, 3, 7] -> "1-3, 7" """
+    ranges = []
+    for page_number in pages:
+        if ranges and page_number == ranges[-1][1] + 1:
+            ranges[-1][1] = page_number
+        else:
+            ranges.append([page_number, page_number])
+    return ", ".join(str(a) if a == b else f"{a}-{b}" for a, b in ranges)
+
+
+def format_stage_summary(stats, seconds):
+    """Aşama sürelerini en yavaştan başlayarak günlük satırlarına çevir"""
+    lines = [f"  ⏱ Süre: {seconds:.2f} sn"]
+    stages = sorted(stats["stages"].items(), key=lambda item: item[1]["wall"], reverse=True)
+    for name, record in stages:
+        share = record["wall"] / seconds * 100 if seconds and "/" not in name else None
+        lines.append(f"    {name}: {record['wall']:.3f} sn duvar, {record['cpu']:.3f} sn CPU, "
+                     f"{record['calls']} çağrı"
+                     + (f", {format_size(record['bytes'])}" if record["bytes"] else "")
+                     + (f" (%{share:.0f})" if share is not None else "")
+                     + (" (iş parçacıklarında eşzamanlı)" if name.endswith("/threads") else ""))
+    return lines
+
+
+def write_timing_report(results, path):
+    """Dosya ve sayfa bazında aşama sürelerini JSON ya da CSV (uzantıya göre) olarak yaz"""
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["file", "page", "stage", "calls", "wall", "cpu", "bytes"])
+            for result in results:
+                if "error" in result:
+                    continue
+                stats = result["stats"]
+                for name, record in stats.get("stages", {}).items():
+                    writer.writerow([result["file"], "", name, record["calls"],
+                                     round(record["wall"], 6), round(record["cpu"], 6), record["bytes"]])
+                for record in stats.get("page_stages") or ():
+                    writer.writerow([result["file"], record["page"], record["stage"], record["calls"],
+                                     round(record["wall"], 6), round(record["cpu"], 6), record["bytes"]])
+        return
+    
+    report = [{
+        "file": result["file"],
+        "cached": result["cached"],
+        "seconds": result.get("seconds"),
+        "pages": result["pages"],
+        "stages": result["stats"].get("stages", {}),
+        "page_stages": result["stats"].get("page_stages") or [],
+    } for result in results if "error" not in result]
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, ensure_ascii=False, indent=2)
+
+
+def _file_digest(path):
+    """Dosya içeriğinin SHA-256 özeti (parça parça okunur)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def result_cache_key(file_digest, options):
+    """Girdi özeti ve çıktıyı etkileyen ayarlardan önbellek anahtarı üret.
+
+    Yalnızca hızı etkileyen ayarlar (işçi sayısı, bellek sınırı vb.) anahtara
+    girmez; diğer tüm ayarlar, sonradan eklenenler de dahil, anahtarı değiştirir.
+    """
+    normalized = {key: value for key, value in sorted(options.items())
+                  if key not in PERFORMANCE_OPTION_KEYS}
+    material = json.dumps([RESULT_CACHE_VERSION, file_digest, normalized], sort_keys=True)
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def load_result_cache(path):
+    """Önbellek manifestosunu oku; yoksa veya bozuksa boş sözlük döndür"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != RESULT_CACHE_VERSION:
+        return {}
+    return manifest.get("entries", {})
+
+
+def save_result_cache(path, entries):
+    """Manifestoyu geçici dosya üzerinden atomik olarak yaz"""
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".cache_", suffix=".json", dir=folder)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"version": RESULT_CACHE_VERSION, "entries": entries}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+# Süreç başına okunmuş manifesto: (yol, mtime) -> girdiler
+_result_cache_entries = {}
+
+
+def _read_result_cache(path):
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    if _result_cache_entries.get("key") != (path, mtime):
+        _result_cache_entries["key"] = (path, mtime)
+        _result_cache_entries["entries"] = load_result_cache(path)
+    return _result_cache_entries["entries"]
+
+
+def _cached_result(manifest_path, cache_key, file_path, output_path, log):
+    """Geçerli bir önbellek kaydı varsa çıktıyı hazırlayıp sonucu döndür"""
+    entry = _read_result_cache(manifest_path).get(cache_key)
+    if entry is None:
+        return None
+    try:
+        stat = os.stat(entry["output"])
+    except OSError:
+        return None
+    if stat.st_size != entry["compressed_size"] or stat.st_mtime_ns != entry["output_mtime_ns"]:
+        return None
+    
+    if os.path.abspath(entry["output"]) == os.path.abspath(output_path):
+        log("♻️ Girdi ve ayarlar değişmemiş, atlandı")
+    else:
+        shutil.copyfile(entry["output"], f"{output_path}.part")
+        os.replace(f"{output_path}.part", output_path)
+        log(f"♻️ Önbellekten kopyalandı: {os.path.basename(entry['output'])}")
+    log("-" * 60)
+    return {**entry["result"], "file": file_path, "output": output_path,
+            "cached": True, "cache_key": cache_key}
+
+
+def _store_results(manifest_path, results, key_field):
+    """Yeni sonuçları `key_field` anahtarıyla manifestoya ekle; (isabet, ıska, atlanan bayt) döndür"""
+    entries = load_result_cache(manifest_path)
+    hits = misses = skipped_bytes = 0
+    for result in results:
+        if "error" in result:
+            continue
+        if result["cached"]:
+            hits += 1
+            skipped_bytes += result["original_size"]
+            continue
+        misses += 1
+        entries[result[key_field]] = {
+            "input": result["file"],
+            "output": result["output"],
+            "compressed_size": result["compressed_size"],
+            "output_mtime_ns": os.stat(result["output"]).st_mtime_ns,
+            # Sayfa bazındaki süreler manifestoyu şişirmesin diye saklanmaz
+            "result": {**{key: value for key, value in result.items()
+                          if key not in ("file", "output", "cached", "cache_key", "checkpoint_key")},
+                       "stats": {**result["stats"], "page_stages": None, "page_colors": []}},
+        }
+    save_result_cache(manifest_path, entries)
+    return hits, misses, skipped_bytes
+
+
+def _update_result_cache(manifest_path, results, log):
+    """Toplu iş sonunda manifestoyu yeni sonuçlarla güncelle ve istatistikleri yaz"""
+    hits, misses, skipped_bytes = _store_results(manifest_path, results, "cache_key")
+    log(f"♻️ Sonuç önbelleği: {hits} isabet, {misses} ıska, "
+        f"{format_size(skipped_bytes)} veri yeniden işlenmedi")
+
+
+def _checkpoint_key(file_path, options):
+    """Kontrol noktası anahtarı: içerik özeti yerine yol, boyut ve değişiklik zamanı"""
+    stat = os.stat(file_path)
+    identity = f"{os.path.abspath(file_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    return result_cache_key(identity, options)
+
+
+def _checkpoint_parts_dir(checkpoint_path, checkpoint_key):
+    """Yarım kalan dosyanın akışlı parçalarının tutulduğu klasör"""
+    return os.path.join(f"{checkpoint_path}.parts", checkpoint_key[:16])
+
+
+def _update_checkpoint(checkpoint_path, result):
+    """Biten dosyayı kontrol noktasına hemen yaz; iptal veya çökmede kaybolmasın"""
+    if "error" not in result and not result["cached"]:
+        _store_results(checkpoint_path, [result], "checkpoint_key")
+
+
+def count_pages(paths):
+    """Her dosyanın sayfa sayısı; açılamayanlar 1 sayılır (ilerleme ağırlıkları için)"""
+    counts = []
+    for path in paths:
+        try:
+            with fitz.open(path) as doc:
+                counts.append(max(1, doc.page_count))
+        except Exception:
+            counts.append(1)
+    return counts
+
+
+class ProgressTracker:
+    """Toplu işin ilerlemesini sayfa sayısıyla ağırlıklandırır, verim ve kalan süreyi ölçer.
+
+    Paralel işlenen dosyaların ilerlemeleri ayrı tutulup toplanır. Verim son
+    THROUGHPUT_WINDOW saniyede gerçekten işlenen sayfalardan ölçülür;
+    önbellekten gelen veya atlanan dosyalar ilerlemeye girer ama verimi
+    şişirmez. Biten dosyaların süreleri strateji bazında da toplanır.
+    """
+
+    def __init__(self, page_counts):
+        self.page_counts = list(page_counts)
+        self.total = sum(self.page_counts) or 1
+        self.done = [0.0] * len(self.page_counts)
+        self.skipped = 0.0
+        self.skipped_files = 0
+        self.started = time.monotonic()
+        self.samples = deque([(self.started, 0.0)])
+        self.last_emit = 0.0
+        self.strategies = {}  # strateji -> [sayfa, saniye]
+
+    def update(self, index, fraction):
+        """Dosyanın 0-1 arası ilerlemesini işle (geri gitmez)"""
+        pages = min(1.0, fraction) * self.page_counts[index]
+        self.done[index] = max(self.done[index], pages)
+
+    def finish(self, index, result):
+        """Biten dosyanın sonucunu işle"""
+        remaining = self.page_counts[index] - self.done[index]
+        self.done[index] = self.page_counts[index]
+        strategies = ("raster", "images", "copy", "text")
+        stats = result.get("stats")
+        # Önbellekten gelen, hatalı ya da ön analizde atlanan (hiç sayfa işlenmemiş)
+        # dosyalar verime ve strateji dağılımına girmez
+        if (result.get("cached") or "error" in result or stats is None
+                or not any(stats[f"pages_{name}"] for name in strategies)):
+            self.skipped += remaining
+            self.skipped_files += 1
+            return
+        strategy = max(strategies, key=lambda name: stats[f"pages_{name}"])
+        record = self.strategies.setdefault(strategy, [0, 0.0])
+        record[0] += result["pages"]
+        record[1] += result["seconds"]
+
+    def should_emit(self, force=False):
+        """Arayüz en fazla PROGRESS_INTERVAL aralıkla güncellensin"""
+        now = time.monotonic()
+        if force or now - self.last_emit >= PROGRESS_INTERVAL:
+            self.last_emit = now
+            return True
+        return False
+
+    def snapshot(self):
+        """Yüzde, işlenen/toplam sayfa, sayfa/sn, kalan süre (bilinmiyorsa None)"""
+        now = time.monotonic()
+        done = sum(self.done)
+        processed = done - self.skipped
+        self.samples.append((now, processed))
+        while len(self.samples) > 2 and now - self.samples[1][0] >= THROUGHPUT_WINDOW:
+            self.samples.popleft()
+        since, processed_then = self.samples[0]
+        rate = (processed - processed_then) / (now - since) if now > since else 0.0
+        remaining = self.total - done
+        return {
+            "percent": done / self.total * 100,
+            "pages_done": round(done),
+            "pages_total": self.total,
+            "pages_per_sec": rate,
+            "eta": remaining / rate if rate > 0 else None,
+            "elapsed": now - self.started,
+            "strategies": {name: pages / seconds for name, (pages, seconds) in self.strategies.items()
+                           if seconds > 0},
+            "skipped_files": self.skipped_files,
+        }
+
+
+# İşçi süreçlerinin olayları ana sürece gönderdiği kuyruk
+_worker_events = None
+
+
+def _init_worker(events, control=None):
+    global _worker_events, _job_control
+    _worker_events = events
+    _job_control = control
+    if control is not None:
+        # Ctrl+C ana süreçte işbirlikçi iptale çevrilir; işçiler yarıda ölmesin
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _compress_file_worker(index, file_path, output_folder, options):
+    """İşçi süreçte bir dosyayı sıkıştırır, olayları kuyruğa yazar"""
+    def log(message):
+        _worker_events.put(("log", index, message))
+
+    def progress(done, total):
+        _worker_events.put(("progress", index, done, total))
+
+    _check_control()
+    return compress_file(file_path, output_folder, options, log, progress)
+
+
+def _file_failed(file_path, error, log):
+    """Bir dosyanın hatası toplu işi durdurmaz, sadece kaydedilir"""
+    log(f"❌ Hata ({os.path.basename(file_path)}): {error}")
+    log("-" * 60)
+    return {"file": file_path, "error": str(error)}
+
+
+def _file_cancelled(file_path):
+    """İptal nedeniyle bitirilmeyen dosyanın sonucu (hata olarak sayılır)"""
+    return {"file": file_path, "error": "İptal edildi", "cancelled": True}
+
+
+def _prefetch_file(path):
+    """Dosyayı arka planda okuyup işletim sistemi önbelleğine al (veri atılır)"""
+    def read():
+        try:
+            with open(path, "rb") as f:
+                while f.read(PREFETCH_BLOCK):
+                    pass
+        except OSError:
+            pass
+    threading.Thread(target=read, daemon=True).start()
+
+
+def _run_serial(input_files, output_folder, options, log, file_progress, file_done, page_pool=None):
+    results = []
+    for i, file_path in enumerate(input_files):
+        # Sıradaki dosya bu dosya işlenip kaydedilirken diskten okunur
+        if i + 1 < len(input_files):
+            _prefetch_file(input_files[i + 1])
+        try:
+            _check_control()
+            result = compress_file(file_path, output_folder, options, log,
+                                   lambda done, total, i=i: file_progress(i, done / total),
+                                   page_pool)
+        except CompressionCancelled:
+            results.extend(_file_cancelled(path) for path in input_files[i:])
+            break
+        except Exception as e:
+            result = _file_failed(file_path, e, log)
+        results.append(result)
+        if options["checkpoint"]:
+            _update_checkpoint(options["checkpoint"], result)
+        file_done(i, result)
+        file_progress(i, 1.0)
+    return results
+
+
+def _run_parallel(input_files, output_folder, options, log, file_progress, file_done):
+    """Dosyaları ayrı süreçlerde paralel sıkıştırır"""
+    total_files = len(input_files)
+    workers = min(options["workers"], total_files)
+    ctx = multiprocessing.get_context("spawn")
+    events = ctx.Queue()
+    results = [None] * total_files
+    log(f"Paralel işlem: {workers} işçi süreç")
+
+    def drain_events():
+        # İşçi süreçlerden gelen log ve ilerleme olaylarını geri çağrılara aktar
+        while True:
+            try:
+                event = events.get_nowait()
+            except queue.Empty:
+                return
+            if event[0] == "log":
+                _, i, message = event
+                log(f"[{os.path.basename(input_files[i])}] {message}")
+            elif event[0] == "progress":
+                _, i, done, total = event
+                file_progress(i, done / total)
+    
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=_init_worker, initargs=(events, _job_control)) as pool:
+        futures = {
+            pool.submit(_compress_file_worker, i, file_path, output_folder, options): i
+            for i, file_path in enumerate(input_files)
+        }
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            drain_events()
+            if _job_control is not None and _job_control.cancelled:
+                # Henüz başlamamış dosyaları kuyruktan çek; çalışanlar sayfa arasında durur
+                for future in [future for future in pending if future.cancel()]:
+                    pending.discard(future)
+                    results[futures[future]] = _file_cancelled(input_files[futures[future]])
+            for future in done:
+                i = futures[future]
+                error = future.exception()
+                if isinstance(error, CompressionCancelled):
+                    results[i] = _file_cancelled(input_files[i])
+                    continue
+                if error is not None:
+                    results[i] = _file_failed(input_files[i], error, log)
+                else:
+                    results[i] = future.result()
+                if options["checkpoint"]:
+                    _update_checkpoint(options["checkpoint"], results[i])
+                file_done(i, results[i])
+                file_progress(i, 1.0)
+    drain_events()
+    return results
+
+
+def run_batch(input_files, output_folder, options, log, file_progress, control=None, file_done=None):
+    """Dosya listesini sıkıştırır ve her dosya için bir sonuç sözlüğü döndürür.
+
+    `workers` > 1 ise dosyalar ayrı süreçlerde paralel işlenir; `split_pages`
+    açıksa dosyalar sırayla, sayfa aralıkları paralel işlenir. Başarısız
+    dosyaların sonucunda `error` anahtarı bulunur. `file_progress(indeks,
+    oran)` her dosyanın 0-1 arası ilerlemesini, `file_done(indeks, sonuç)`
+    ise biten her dosyanın sonucunu (paralel modda da ana süreçte) bildirir.
+
+    `control` (`JobControl`) verilirse iş sayfalar arasında duraklatılabilir
+    ve iptal edilebilir; iptalde bitmeyen dosyaların sonucunda `cancelled`
+    bulunur. `checkpoint` ayarı biten dosyaları her dosyadan sonra kaydeder;
+    aynı kontrol noktasıyla yeniden başlatılan iş bitmiş dosyaları atlar,
+    akışlı modda yarım kalan dosyaya son boşaltılan parçadan devam eder.
+    """
+    global _job_control
+    options = {**DEFAULT_OPTIONS, **options}
+    file_done = file_done or (lambda index, result: None)
+    previous_control, _job_control = _job_control, control
+    try:
+        if options["workers"] > 1 and options["split_pages"]:
+            # Dosyaları sırayla, her dosyanın sayfalarını ise paralel işle
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=options["workers"], mp_context=ctx,
+                                     initializer=_init_worker, initargs=(None, control)) as page_pool:
+                results = _run_serial(input_files, output_folder, options, log, file_progress, file_done,
+                                      page_pool)
+        elif options["workers"] > 1 and len(input_files) > 1:
+            results = _run_parallel(input_files, output_folder, options, log, file_progress, file_done)
+        else:
+            results = _run_serial(input_files, output_folder, options, log, file_progress, file_done)
+    finally:
+        _job_control = previous_control
+    
+    cancelled = sum(1 for result in results if result.get("cancelled"))
+    if cancelled:
+        log(f"⏹ İşlem iptal edildi: {len(results) - cancelled} dosya bitti, {cancelled} dosya kaldı")
+        if options["checkpoint"]:
+            log(f"Kontrol noktası: {options['checkpoint']} (aynı ayarlarla yeniden başlatınca kaldığı yerden devam eder)")
+    if options["result_cache"]:
+        _update_result_cache(options["result_cache"], results, log)
+    if options["timing_report"]:
+        write_timing_report(results, options["timing_report"])
+        log(f"Süre raporu yazıldı: {options['timing_report']}")
+    return results
+
+
+def compress(path, options=None, output_folder=None, log=None):
+    """Kütüphane API'si: tek bir PDF'yi sıkıştırıp sonuç sözlüğünü döndür.
+
+    `options` verilmeyen anahtarlarda `DEFAULT_OPTIONS` kullanılır. Çıktı
+    klasörü verilmezse `<ad>_compressed.pdf` girdinin yanına yazılır.
+    """
+    options = {**DEFAULT_OPTIONS, **(options or {})}
+    log = log or (lambda message: None)
+    if output_folder:
+        os.makedirs(output_folder, exist_ok=True)
+    result = compress_file(path, output_folder, options, log, lambda done, total: None)
+    if options["result_cache"]:
+        _update_result_cache(options["result_cache"], [result], log)
+    return result
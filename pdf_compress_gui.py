@@ -0,0 +1,700 @@
+import sys
+import os
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
+                             QWidget, QPushButton, QLabel, QProgressBar, QTextEdit, 
+                             QFileDialog, QGroupBox, QComboBox, QSpinBox, QCheckBox,
+                             QMessageBox, QGridLayout, QFrame, QSlider)
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
+
+from pdf_compress_core import (CHECKPOINT_FILE, CLEANUP_CATEGORIES, PREFLIGHT_MIN_SAVINGS, RESULT_CACHE_FILE,
+                               JobControl, ProgressTracker, count_pages, format_duration, format_size,
+                               run_batch)
+
+
+class PDFCompressorThread(QThread):
+    progress_updated = pyqtSignal(int)
+    # sayfa/sn, kalan süre (sn, bilinmiyorsa -1), işlenen sayfa, toplam sayfa
+    throughput_updated = pyqtSignal(float, float, int, int)
+    log_updated = pyqtSignal(str)
+    finished_signal = pyqtSignal(bool, str)
+    
+    def __init__(self, input_files, output_folder, quality, dpi, remove_images, 
+                 remove_annotations, compress_fonts, max_image_size, compression_level,
+                 workers=1, split_pages=False, supersample=1, mode="raster",
+                 image_cache_mb=64, streaming=False, chunk_pages=50, memory_limit_mb=0,
+                 target_size_mb=0, result_cache="", timing_summary=False, encoder="jpeg",
+                 gray_detect=False, checkpoint="", preflight=False, cleanup=(),
+                 optimize_fonts=False):
+        super().__init__()
+        self.input_files = input_files
+        self.output_folder = output_folder
+        self.quality = quality
+        self.dpi = dpi
+        self.remove_images = remove_images
+        self.remove_annotations = remove_annotations
+        self.compress_fonts = compress_fonts
+        self.max_image_size = max_image_size
+        self.compression_level = compression_level
+        self.workers = max(1, workers)
+        self.split_pages = split_pages
+        self.supersample = supersample
+        self.mode = mode
+        self.image_cache_mb = image_cache_mb
+        self.streaming = streaming
+        self.chunk_pages = chunk_pages
+        self.memory_limit_mb = memory_limit_mb
+        self.target_size_mb = target_size_mb
+        self.result_cache = result_cache
+        self.timing_summary = timing_summary
+        self.encoder = encoder
+        self.gray_detect = gray_detect
+        self.checkpoint = checkpoint
+        self.preflight = preflight
+        self.cleanup = tuple(cleanup)
+        self.optimize_fonts = optimize_fonts
+        self.control = JobControl()
+        
+    def options(self):
+        """İşçi süreçlere gönderilebilen (pickle edilebilir) ayar sözlüğü"""
+        return {
+            "quality": self.quality,
+            "dpi": self.dpi,
+            "remove_images": self.remove_images,
+            "remove_annotations": self.remove_annotations,
+            "compress_fonts": self.compress_fonts,
+            "max_image_size": self.max_image_size,
+            "compression_level": self.compression_level,
+            "workers": self.workers,
+            "split_pages": self.split_pages,
+            "supersample": self.supersample,
+            "mode": self.mode,
+            "image_cache_mb": self.image_cache_mb,
+            "streaming": self.streaming,
+            "chunk_pages": self.chunk_pages,
+            "memory_limit_mb": self.memory_limit_mb,
+            "target_size_mb": self.target_size_mb,
+            "result_cache": self.result_cache,
+            "timing_summary": self.timing_summary,
+            "encoder": self.encoder,
+            "gray_detect": self.gray_detect,
+            "checkpoint": self.checkpoint,
+            "preflight": self.preflight,
+            "min_savings": PREFLIGHT_MIN_SAVINGS if self.preflight else 0,
+            "cleanup": self.cleanup,
+            "optimize_fonts": self.optimize_fonts,
+        }
+
+    def run(self):
+        try:
+            total_files = len(self.input_files)
+            self.tracker = ProgressTracker(count_pages(self.input_files))
+            results = run_batch(self.input_files, self.output_folder, self.options(),
+                                self.log_updated.emit, self.update_file_progress, self.control,
+                                self.file_finished)
+            self.emit_progress(force=True)
+            
+            failed = [result["file"] for result in results if "error" in result]
+            if self.control.cancelled:
+                done = total_files - sum(1 for result in results if result.get("cancelled"))
+                self.finished_signal.emit(False, f"İşlem iptal edildi: {done}/{total_files} dosya tamamlandı")
+            elif failed:
+                names = ", ".join(os.path.basename(f) for f in failed)
+                self.finished_signal.emit(
+                    False, f"{len(failed)}/{total_files} dosya sıkıştırılamadı: {names}")
+            else:
+                self.finished_signal.emit(True, "Tüm dosyalar başarıyla sıkıştırıldı!")
+            
+        except Exception as e:
+            self.finished_signal.emit(False, f"Hata oluştu: {str(e)}")
+
+    def cancel(self):
+        """Sayfa arasında durdur (duraklatılmışsa da)"""
+        self.control.cancel()
+
+    def pause(self):
+        self.control.pause()
+
+    def resume(self):
+        self.control.resume()
+
+    def update_file_progress(self, index, fraction):
+        self.tracker.update(index, fraction)
+        self.emit_progress()
+
+    def file_finished(self, index, result):
+        self.tracker.finish(index, result)
+        self.emit_progress(force=True)
+
+    def emit_progress(self, force=False):
+        # Her sayfada değil, en fazla PROGRESS_INTERVAL aralıkla arayüze bildir
+        if not self.tracker.should_emit(force):
+            return
+        snapshot = self.tracker.snapshot()
+        self.progress_updated.emit(int(snapshot["percent"]))
+        eta = snapshot["eta"]
+        self.throughput_updated.emit(snapshot["pages_per_sec"], -1.0 if eta is None else eta,
+                                     snapshot["pages_done"], snapshot["pages_total"])
+
+    def format_size(self, size):
+        """Dosya boyutunu okunabilir formatta döndür"""
+        return format_size(size)
+
+
+class PDFCompressorGUI(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.input_files = []
+        self.output_folder = ""
+        self.compressor_thread = None
+        self.init_ui()
+        
+    def init_ui(self):
+        self.setWindowTitle("PDF Boyut Küçültücü - Büyük Dosya Desteği")
+        self.setGeometry(100, 100, 900, 700)
+        
+        # Ana widget
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        
+        # Ana layout
+        main_layout = QVBoxLayout(main_widget)
+        main_layout.setSpacing(15)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        
+        # Başlık
+        title_label = QLabel("PDF Boyut Küçültücü")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_label.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        title_label.setStyleSheet("color: #2E86C1; margin: 10px;")
+        main_layout.addWidget(title_label)
+        
+        # Bilgi etiketi
+        info_label = QLabel("30MB+ büyük PDF dosyaları için özel optimizasyonlar")
+        info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        info_label.setStyleSheet("color: #28B463; font-style: italic;")
+        main_layout.addWidget(info_label)
+        
+        # Dosya seçimi grubu
+        file_group = QGroupBox("📁 Dosya Seçimi")
+        file_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        file_layout = QVBoxLayout(file_group)
+        
+        # Dosya seçim butonları
+        file_button_layout = QHBoxLayout()
+        
+        self.select_files_btn = QPushButton("📄 PDF Dosyalarını Seç")
+        self.select_files_btn.clicked.connect(self.select_input_files)
+        self.select_files_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #3498DB;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 4px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #2980B9;
+            }
+        """)
+        file_button_layout.addWidget(self.select_files_btn)
+        
+        self.select_output_btn = QPushButton("📂 Çıktı Klasörünü Seç")
+        self.select_output_btn.clicked.connect(self.select_output_folder)
+        self.select_output_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #27AE60;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 4px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #229954;
+            }
+        """)
+        file_button_layout.addWidget(self.select_output_btn)
+        
+        file_layout.addLayout(file_button_layout)
+        
+        # Seçilen dosyalar etiketi
+        self.files_label = QLabel("Seçilen dosya yok")
+        self.files_label.setWordWrap(True)
+        self.files_label.setStyleSheet("color: #7F8C8D; padding: 5px;")
+        file_layout.addWidget(self.files_label)
+        
+        # Çıktı klasörü etiketi
+        self.output_label = QLabel("Çıktı klasörü seçilmedi")
+        self.output_label.setWordWrap(True)
+        self.output_label.setStyleSheet("color: #7F8C8D; padding: 5px;")
+        file_layout.addWidget(self.output_label)
+        
+        main_layout.addWidget(file_group)
+        
+        # Sıkıştırma ayarları grubu
+        settings_group = QGroupBox("⚙️ Sıkıştırma Ayarları")
+        settings_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        settings_layout = QGridLayout(settings_group)
+        
+        # Sıkıştırma seviyesi
+        settings_layout.addWidget(QLabel("Sıkıştırma Seviyesi:"), 0, 0)
+        self.compression_combo = QComboBox()
+        self.compression_combo.addItems([
+            "Maksimum Sıkıştırma (En küçük boyut)",
+            "Yüksek Sıkıştırma (Önerilen)",
+            "Normal Sıkıştırma (Hızlı)",
+            "Hızlı Kaydetme (Ara Çıktı)"
+        ])
+        self.compression_combo.setCurrentIndex(1)
+        settings_layout.addWidget(self.compression_combo, 0, 1)
+        
+        # Kalite ayarı
+        settings_layout.addWidget(QLabel("JPEG Kalitesi:"), 1, 0)
+        quality_layout = QHBoxLayout()
+        self.quality_slider = QSlider(Qt.Orientation.Horizontal)
+        self.quality_slider.setRange(10, 95)
+        self.quality_slider.setValue(50)
+        self.quality_slider.valueChanged.connect(self.update_quality_label)
+        self.quality_label = QLabel("50%")
+        quality_layout.addWidget(self.quality_slider)
+        quality_layout.addWidget(self.quality_label)
+        settings_layout.addLayout(quality_layout, 1, 1)
+        
+        # DPI ayarı
+        settings_layout.addWidget(QLabel("DPI (Çözünürlük):"), 2, 0)
+        self.dpi_combo = QComboBox()
+        self.dpi_combo.addItems(["72 (Web)", "96 (Standart)", "150 (İyi)", "200 (Yüksek)", "300 (Maksimum)"])
+        self.dpi_combo.setCurrentIndex(1)  # 96 DPI
+        settings_layout.addWidget(self.dpi_combo, 2, 1)
+        
+        # Maksimum görüntü boyutu
+        settings_layout.addWidget(QLabel("Maks. Görüntü Boyutu:"), 3, 0)
+        self.max_size_combo = QComboBox()
+        self.max_size_combo.addItems([
+            "800x800 (Çok küçük)",
+            "1200x1200 (Küçük)", 
+            "1600x1600 (Orta)",
+            "2000x2000 (Büyük)",
+            "2800x2800 (Çok büyük)"
+        ])
+        self.max_size_combo.setCurrentIndex(2)
+        settings_layout.addWidget(self.max_size_combo, 3, 1)
+        
+        # Paralel işçi sayısı
+        settings_layout.addWidget(QLabel("İşçi Sayısı:"), 4, 0)
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, os.cpu_count() or 1)
+        self.workers_spin.setValue(os.cpu_count() or 1)
+        self.workers_spin.setToolTip("Aynı anda ayrı süreçlerde sıkıştırılacak dosya sayısı")
+        settings_layout.addWidget(self.workers_spin, 4, 1)
+        
+        # Sıkıştırma modu
+        settings_layout.addWidget(QLabel("Sıkıştırma Modu:"), 5, 0)
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems([
+            "Sayfaları Görüntüye Çevir (Raster)",
+            "Sadece Görüntüleri Sıkıştır (Metni Korur)",
+            "Otomatik (Sayfa Bazında)"
+        ])
+        self.mode_combo.setToolTip("Görüntü modu metin ve vektörleri olduğu gibi bırakır, "
+                                   "yalnızca yüksek çözünürlüklü görüntüleri küçültür")
+        settings_layout.addWidget(self.mode_combo, 5, 1)
+        
+        # Seçenekler
+        options_layout = QHBoxLayout()
+        
+        self.remove_images_cb = QCheckBox("🖼️ Görüntüleri Kaldır")
+        self.remove_images_cb.setToolTip("Tüm görüntüleri kaldırır, sadece metni korur")
+        options_layout.addWidget(self.remove_images_cb)
+        
+        self.remove_annotations_cb = QCheckBox("📝 Açıklamaları Kaldır")
+        self.remove_annotations_cb.setToolTip("Yorumları ve açıklamaları kaldırır; bağlantılar ve form alanları korunur")
+        options_layout.addWidget(self.remove_annotations_cb)
+        
+        self.cleanup_cb = QCheckBox("🧹 Gereksiz Nesneleri Temizle")
+        self.cleanup_cb.setToolTip("Gömülü dosyaları, küçük resimleri, XMP üst verisini, kullanılmayan "
+                                   "adlı hedefleri ve JavaScript'i kaldırır")
+        options_layout.addWidget(self.cleanup_cb)
+        
+        self.compress_fonts_cb = QCheckBox("🔤 Fontları Sıkıştır")
+        self.compress_fonts_cb.setChecked(True)
+        self.compress_fonts_cb.setToolTip("Font dosyalarını sıkıştırır")
+        options_layout.addWidget(self.compress_fonts_cb)
+        
+        self.optimize_fonts_cb = QCheckBox("🔠 Fontları Alt Kümele")
+        self.optimize_fonts_cb.setToolTip("Sayfalar vektör olarak kopyalandığında (görüntü/otomatik mod, görüntüleri kaldırma) özdeş gömülü "
+                                          "fontları birleştirir, yalnızca kullanılan glifleri bırakır")
+        options_layout.addWidget(self.optimize_fonts_cb)
+        
+        self.split_pages_cb = QCheckBox("✂️ Sayfaları Böl")
+        self.split_pages_cb.setToolTip("Büyük dosyaların sayfa aralıklarını ayrı süreçlerde paralel işler")
+        options_layout.addWidget(self.split_pages_cb)
+        
+        self.supersample_cb = QCheckBox("🔍 Yüksek Kalite Render")
+        self.supersample_cb.setToolTip("Sayfayı 2 kat çözünürlükte render edip hedef boyuta küçültür (daha yavaş)")
+        options_layout.addWidget(self.supersample_cb)
+        
+        self.streaming_cb = QCheckBox("💾 Akışlı İşleme")
+        self.streaming_cb.setToolTip("1 GB+ dosyalar için sayfaları parçalar halinde diske yazarak belleği sınırlar")
+        options_layout.addWidget(self.streaming_cb)
+        
+        self.result_cache_cb = QCheckBox("♻️ Değişmeyenleri Atla")
+        self.result_cache_cb.setToolTip("İçeriği ve ayarları değişmemiş dosyalar yeniden sıkıştırılmaz "
+                                        "(önbellek çıktı klasöründe tutulur)")
+        options_layout.addWidget(self.result_cache_cb)
+        
+        self.timing_summary_cb = QCheckBox("⏱ Süre Özeti")
+        self.timing_summary_cb.setToolTip("Her dosyadan sonra render, kodlama ve kaydetme gibi "
+                                          "aşamaların sürelerini günlüğe yazar")
+        options_layout.addWidget(self.timing_summary_cb)
+        
+        self.gray_detect_cb = QCheckBox("⚫ Gri Algıla")
+        self.gray_detect_cb.setToolTip("Renk içermeyen sayfa ve görüntüleri gri, siyah-beyaz taramaları 1 bit (CCITT G4) kodlar")
+        options_layout.addWidget(self.gray_detect_cb)
+        
+        self.checkpoint_cb = QCheckBox("⏯ Kaldığı Yerden Devam")
+        self.checkpoint_cb.setToolTip("Biten dosyalar çıktı klasörüne kaydedilir; durdurulan iş yeniden "
+                                      "başlatılınca bunlar atlanır (akışlı modda yarım dosya da devam eder)")
+        options_layout.addWidget(self.checkpoint_cb)
+        
+        self.preflight_cb = QCheckBox("🔍 Ön Analiz")
+        self.preflight_cb.setToolTip(f"Dosyanın görüntü/font/içerik dağılımından kazancı tahmin eder; "
+                                     f"%{PREFLIGHT_MIN_SAVINGS} altı kazanç beklenen dosyalar atlanır")
+        options_layout.addWidget(self.preflight_cb)
+        
+        # Akışlı işlem için bellek sınırı
+        settings_layout.addWidget(QLabel("Bellek Sınırı (MB):"), 6, 0)
+        self.memory_limit_spin = QSpinBox()
+        self.memory_limit_spin.setRange(0, 65536)
+        self.memory_limit_spin.setSingleStep(256)
+        self.memory_limit_spin.setSpecialValueText("Sınırsız")
+        self.memory_limit_spin.setToolTip("Akışlı işlemde aşıldığında sayfa parçaları erkenden diske yazılır")
+        settings_layout.addWidget(self.memory_limit_spin, 6, 1)
+        
+        # Hedef boyut modu
+        settings_layout.addWidget(QLabel("Hedef Boyut (MB):"), 7, 0)
+        self.target_size_spin = QSpinBox()
+        self.target_size_spin.setRange(0, 10000)
+        self.target_size_spin.setSpecialValueText("Kapalı")
+        self.target_size_spin.setToolTip("Kalite ve DPI, çıktı bu boyutun altında kalacak şekilde otomatik seçilir")
+        settings_layout.addWidget(self.target_size_spin, 7, 1)
+        
+        # Görüntü kodlayıcısı
+        settings_layout.addWidget(QLabel("Kodlayıcı:"), 8, 0)
+        self.encoder_combo = QComboBox()
+        self.encoder_combo.addItems([
+            "JPEG (Optimize)",
+            "JPEG (Hızlı)",
+            "JPEG (Aşamalı, Daha Küçük)",
+            "JPEG 2000 (JPX)"
+        ])
+        self.encoder_combo.setToolTip("Sayfa ve görüntülerin hangi biçimde kodlanacağını seçer")
+        settings_layout.addWidget(self.encoder_combo, 8, 1)
+        
+        settings_layout.addLayout(options_layout, 9, 0, 1, 2)
+        
+        main_layout.addWidget(settings_group)
+        
+        # Kontrol butonları
+        control_layout = QHBoxLayout()
+        
+        self.compress_btn = QPushButton("🚀 Sıkıştırmayı Başlat")
+        self.compress_btn.clicked.connect(self.start_compression)
+        self.compress_btn.setEnabled(False)
+        self.compress_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #E74C3C;
+                color: white;
+                border: none;
+                padding: 12px 24px;
+                border-radius: 6px;
+                font-weight: bold;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background-color: #C0392B;
+            }
+            QPushButton:disabled {
+                background-color: #BDC3C7;
+            }
+        """)
+        control_layout.addWidget(self.compress_btn)
+        
+        self.pause_btn = QPushButton("⏸ Duraklat")
+        self.pause_btn.clicked.connect(self.toggle_pause)
+        self.pause_btn.setEnabled(False)
+        control_layout.addWidget(self.pause_btn)
+        
+        self.stop_btn = QPushButton("⏹ Durdur")
+        self.stop_btn.clicked.connect(self.stop_compression)
+        self.stop_btn.setEnabled(False)
+        control_layout.addWidget(self.stop_btn)
+        
+        self.clear_btn = QPushButton("🗑️ Temizle")
+        self.clear_btn.clicked.connect(self.clear_all)
+        self.clear_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #95A5A6;
+                color: white;
+                border: none;
+                padding: 12px 24px;
+                border-radius: 6px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #7F8C8D;
+            }
+        """)
+        control_layout.addWidget(self.clear_btn)
+        
+        main_layout.addLayout(control_layout)
+        
+        # Progress bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setStyleSheet("""
+            QProgressBar {
+                border: 2px solid #BDC3C7;
+                border-radius: 5px;
+                text-align: center;
+                font-weight: bold;
+            }
+            QProgressBar::chunk {
+                background-color: #27AE60;
+                border-radius: 3px;
+            }
+        """)
+        main_layout.addWidget(self.progress_bar)
+        
+        # Log alanı
+        log_group = QGroupBox("📋 İşlem Günlüğü")
+        log_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        log_layout = QVBoxLayout(log_group)
+        
+        self.log_text = QTextEdit()
+        self.log_text.setMaximumHeight(250)
+        self.log_text.setReadOnly(True)
+        self.log_text.setStyleSheet("""
+            QTextEdit {
+                background-color: #2C3E50;
+                color: #ECF0F1;
+                border: 1px solid #34495E;
+                border-radius: 4px;
+                padding: 8px;
+                font-family: 'Consolas', 'Monaco', monospace;
+            }
+        """)
+        log_layout.addWidget(self.log_text)
+        
+        main_layout.addWidget(log_group)
+        
+        # Durum çubuğu
+        self.statusBar().showMessage("Hazır - Büyük PDF dosyaları için optimize edildi")
+        
+    def update_quality_label(self, value):
+        self.quality_label.setText(f"{value}%")
+    
+    def select_input_files(self):
+        files, _ = QFileDialog.getOpenFileNames(
+            self, 
+            "PDF Dosyalarını Seç", 
+            "", 
+            "PDF Dosyaları (*.pdf)"
+        )
+        
+        if files:
+            self.input_files = files
+            total_size = sum(os.path.getsize(f) for f in files)
+            self.files_label.setText(f"{len(files)} dosya seçildi (Toplam: {self.format_size(total_size)})")
+            self.log_text.append(f"✓ {len(files)} PDF dosyası seçildi:")
+            for file in files:
+                size = os.path.getsize(file)
+                self.log_text.append(f"  📄 {os.path.basename(file)} - {self.format_size(size)}")
+                if size > 30 * 1024 * 1024:  # 30MB+
+                    self.log_text.append(f"    ⚠️ Büyük dosya tespit edildi")
+            self.check_ready_to_compress()
+    
+    def select_output_folder(self):
+        folder = QFileDialog.getExistingDirectory(
+            self, 
+            "Çıktı Klasörünü Seç"
+        )
+        
+        if folder:
+            self.output_folder = folder
+            self.output_label.setText(f"Çıktı: {folder}")
+            self.log_text.append(f"✓ Çıktı klasörü seçildi: {folder}")
+            self.check_ready_to_compress()
+    
+    def check_ready_to_compress(self):
+        if self.input_files and self.output_folder:
+            self.compress_btn.setEnabled(True)
+        else:
+            self.compress_btn.setEnabled(False)
+    
+    def start_compression(self):
+        if not self.input_files or not self.output_folder:
+            QMessageBox.warning(self, "Uyarı", "Lütfen dosyaları ve çıktı klasörünü seçin!")
+            return
+        
+        # UI'yi devre dışı bırak
+        self.compress_btn.setEnabled(False)
+        self.select_files_btn.setEnabled(False)
+        self.select_output_btn.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        
+        # Ayarları al
+        quality = self.quality_slider.value()
+        
+        # DPI değerini al
+        dpi_map = {"72 (Web)": 72, "96 (Standart)": 96, "150 (İyi)": 150, 
+                  "200 (Yüksek)": 200, "300 (Maksimum)": 300}
+        dpi = dpi_map[self.dpi_combo.currentText()]
+        
+        # Maksimum görüntü boyutunu al
+        size_map = {"800x800 (Çok küçük)": 800, "1200x1200 (Küçük)": 1200,
+                   "1600x1600 (Orta)": 1600, "2000x2000 (Büyük)": 2000,
+                   "2800x2800 (Çok büyük)": 2800}
+        max_image_size = size_map[self.max_size_combo.currentText()]
+        
+        compression_level = self.compression_combo.currentIndex()
+        remove_images = self.remove_images_cb.isChecked()
+        remove_annotations = self.remove_annotations_cb.isChecked()
+        compress_fonts = self.compress_fonts_cb.isChecked()
+        workers = self.workers_spin.value()
+        split_pages = self.split_pages_cb.isChecked()
+        supersample = 2 if self.supersample_cb.isChecked() else 1
+        mode = ["raster", "images", "auto"][self.mode_combo.currentIndex()]
+        streaming = self.streaming_cb.isChecked()
+        memory_limit_mb = self.memory_limit_spin.value()
+        target_size_mb = self.target_size_spin.value()
+        result_cache = (os.path.join(self.output_folder, RESULT_CACHE_FILE)
+                        if self.result_cache_cb.isChecked() else "")
+        checkpoint = (os.path.join(self.output_folder, CHECKPOINT_FILE)
+                      if self.checkpoint_cb.isChecked() else "")
+        
+        # Sıkıştırma thread'ini başlat
+        self.compressor_thread = PDFCompressorThread(
+            self.input_files, self.output_folder, quality, dpi,
+            remove_images, remove_annotations, compress_fonts,
+            max_image_size, compression_level, workers, split_pages, supersample, mode,
+            streaming=streaming, memory_limit_mb=memory_limit_mb, target_size_mb=target_size_mb,
+            result_cache=result_cache, timing_summary=self.timing_summary_cb.isChecked(),
+            encoder=["jpeg", "jpeg-fast", "jpeg-progressive", "jpx"][self.encoder_combo.currentIndex()],
+            gray_detect=self.gray_detect_cb.isChecked(), checkpoint=checkpoint,
+            preflight=self.preflight_cb.isChecked(),
+            cleanup=[category for category in CLEANUP_CATEGORIES
+                     if category not in ("annotations", "links", "widgets")] if self.cleanup_cb.isChecked() else (),
+            optimize_fonts=self.optimize_fonts_cb.isChecked()
+        )
+        self.compressor_thread.progress_updated.connect(self.update_progress)
+        self.compressor_thread.throughput_updated.connect(self.update_throughput)
+        self.compressor_thread.log_updated.connect(self.update_log)
+        self.compressor_thread.finished_signal.connect(self.compression_finished)
+        self.compressor_thread.start()
+        self.pause_btn.setEnabled(True)
+        self.stop_btn.setEnabled(True)
+        
+        self.statusBar().showMessage("Sıkıştırma işlemi devam ediyor...")
+        self.log_text.append("🚀 Sıkıştırma işlemi başlatıldı...")
+        self.log_text.append("=" * 60)
+    
+    def toggle_pause(self):
+        # İşçiler geçerli sayfayı bitirip bekler
+        if self.compressor_thread.control.paused:
+            self.compressor_thread.resume()
+            self.pause_btn.setText("⏸ Duraklat")
+            self.statusBar().showMessage("Sıkıştırma işlemi devam ediyor...")
+        else:
+            self.compressor_thread.pause()
+            self.pause_btn.setText("▶ Devam Et")
+            self.statusBar().showMessage("Duraklatıldı")
+    
+    def stop_compression(self):
+        self.compressor_thread.cancel()
+        self.pause_btn.setEnabled(False)
+        self.stop_btn.setEnabled(False)
+        self.statusBar().showMessage("Durduruluyor, geçerli sayfa bitiriliyor...")
+    
+    def update_progress(self, value):
+        self.progress_bar.setValue(value)
+    
+    def update_throughput(self, pages_per_sec, eta, pages_done, pages_total):
+        if self.compressor_thread.control.paused:
+            return
+        message = f"Sıkıştırılıyor: {pages_done}/{pages_total} sayfa, {pages_per_sec:.1f} sayfa/sn"
+        if eta >= 0:
+            message += f", kalan ~{format_duration(eta)}"
+        self.statusBar().showMessage(message)
+    
+    def update_log(self, message):
+        self.log_text.append(message)
+        self.log_text.verticalScrollBar().setValue(
+            self.log_text.verticalScrollBar().maximum()
+        )
+    
+    def compression_finished(self, success, message):
+        # UI'yi yeniden etkinleştir
+        self.compress_btn.setEnabled(True)
+        self.select_files_btn.setEnabled(True)
+        self.select_output_btn.setEnabled(True)
+        self.pause_btn.setEnabled(False)
+        self.pause_btn.setText("⏸ Duraklat")
+        self.stop_btn.setEnabled(False)
+        self.progress_bar.setVisible(False)
+        
+        if success:
+            self.statusBar().showMessage("Sıkıştırma tamamlandı!")
+            self.log_text.append("🎉 " + message)
+            QMessageBox.information(self, "Başarılı", message)
+        else:
+            self.statusBar().showMessage("Sıkıştırma başarısız!")
+            self.log_text.append("❌ " + message)
+            QMessageBox.critical(self, "Hata", message)
+    
+    def clear_all(self):
+        self.input_files = []
+        self.output_folder = ""
+        self.files_label.setText("Seçilen dosya yok")
+        self.output_label.setText("Çıktı klasörü seçilmedi")
+        self.log_text.clear()
+        self.progress_bar.setVisible(False)
+        self.compress_btn.setEnabled(False)
+        self.statusBar().showMessage("Temizlendi")
+    
+    def format_size(self, size):
+        """Dosya boyutunu okunabilir formatta döndür"""
+        return format_size(size)
+
+
+def main():
+    app = QApplication(sys.argv)
+    
+    # Fusion stilini ayarla
+    app.setStyle('Fusion')
+    
+    # Modern koyu tema
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window, QColor(45, 45, 48))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.Base, QColor(30, 30, 30))
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(45, 45, 48))
+    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(0, 0, 0))
+    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.Text, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.Button, QColor(45, 45, 48))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
+    palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
+    palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
+    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
+    app.setPalette(palette)
+    
+    # Ana pencereyi oluştur ve göster
+    window = PDFCompressorGUI()
+    window.show()
+    
+    sys.exit(app.exec())
@@ -0,0 +1,352 @@
+"""Klasör izleme servisi: tarayıcıların bıraktığı PDF'leri sürekli sıkıştırır.
+
+İşçi süreçler servis boyunca açık kalır; PyMuPDF ve Pillow her dosyada
+yeniden yüklenmez. `watchdog` kuruluysa dosya sistemi olayları (Linux'ta
+inotify) kullanılır, değilse klasör periyodik olarak taranır. Qt içe aktarılmaz.
+
+Örnek:
+    python pdf-compress.py --watch gelen -o cikti --jobs 4 --status-port 8765
+"""
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # İsteğe bağlı: yoksa klasör periyodik olarak taranır
+    Observer = None
+
+from pdf_compress_core import (DEFAULT_OPTIONS, CompressionCancelled, JobControl, _compress_file_worker,
+                               _init_worker, _store_results, format_size)
+
+# Dosyanın yazımı bitti sayılmadan önce boyutunun değişmeden kalması gereken süre
+SETTLE_SECONDS = 2.0
+POLL_INTERVAL = 5.0
+# Olay tabanlı izlemede kaçan olaylar için yine de yapılan tam tarama aralığı
+RESCAN_INTERVAL = 60.0
+# Verim ve gecikme bu kadar son dosya üzerinden hesaplanır
+METRICS_WINDOW = 100
+STATUS_INTERVAL = 1.0
+
+
+if Observer is not None:
+    class _EventHandler(FileSystemEventHandler):
+        """Oluşturulan, taşınan veya değişen PDF'leri aday olarak bildirir"""
+
+        def __init__(self, notify):
+            super().__init__()
+            self.notify = notify
+
+        def on_created(self, event):
+            if not event.is_directory:
+                self.notify(event.src_path)
+
+        def on_modified(self, event):
+            if not event.is_directory:
+                self.notify(event.src_path)
+
+        def on_moved(self, event):
+            if not event.is_directory:
+                self.notify(event.dest_path)
+
+
+def _is_pdf(path):
+    name = os.path.basename(path)
+    return name.lower().endswith(".pdf") and not name.startswith(".")
+
+
+def _output_path(file_path, output_folder):
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(output_folder, f"{base_name}_compressed.pdf")
+
+
+def _write_json_atomic(path, data):
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".status_", suffix=".json", dir=folder)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class FolderWatcher:
+    """Girdi klasörünü izleyip yeni PDF'leri sıcak işçi havuzuna veren servis.
+
+    Yeni dosyalar boyutları `SETTLE_SECONDS` boyunca değişmeyince kuyruğa
+    alınır; çıktısı girdiden yeni olan dosyalar atlanır. Çıktılar motor
+    tarafından önce `.part` dosyasına yazılıp yerine taşınır. `result_cache`
+    ayarı verilirse toplu işteki gibi içeriği ve ayarları değişmeyen dosyalar
+    yeniden sıkıştırılmaz; manifesto her dosyadan sonra güncellenir. Durum
+    ölçümleri `status_path` dosyasına ve/veya `127.0.0.1:status_port` adresine
+    yazılır.
+    """
+
+    def __init__(self, input_folder, output_folder, options, log, status_path="", status_port=0,
+                 poll_interval=POLL_INTERVAL, use_events=True):
+        self.input_folder = os.path.abspath(input_folder)
+        self.output_folder = os.path.abspath(output_folder)
+        self.options = {**DEFAULT_OPTIONS, **options}
+        self.log = log
+        self.status_path = status_path
+        self.status_port = status_port
+        self.poll_interval = poll_interval
+        self.use_events = use_events and Observer is not None
+        self.control = JobControl()
+        self._stop = threading.Event()
+        self._candidates = {}  # yol -> (boyut, mtime, boyutun ilk görüldüğü an, ilk algılama anı)
+        self._notified = queue.Queue()
+        self._waiting = deque()  # (yol, algılama anı, (boyut, mtime)): havuza verilmeyi bekleyenler
+        self._running = {}  # future -> (yol, algılama anı, başlama anı, (boyut, mtime))
+        self._done = {}  # yol -> işlendiği sürümün (boyut, mtime) değeri
+        self._paths = {}  # işçi olaylarındaki indeks -> yol (havuz yenilense de geçerli)
+        self._next_index = 0
+        self._retired = []  # biten dosyaların indeksleri; sonraki boşaltmadan sonra silinir
+        self._recent = deque(maxlen=METRICS_WINDOW)  # (bitiş anı, gecikme, süre, girdi, çıktı)
+        self._totals = {"processed": 0, "failed": 0, "cached": 0, "bytes_in": 0, "bytes_out": 0}
+        self._started = time.time()
+        self._status = {}
+        self._status_lock = threading.Lock()
+
+    def stop(self):
+        """Servisi durdur; çalışan dosyalar sayfa arasında iptal edilir"""
+        self._stop.set()
+        self.control.cancel()
+
+    def run(self):
+        os.makedirs(self.output_folder, exist_ok=True)
+        workers = max(1, self.options["workers"])
+        ctx = multiprocessing.get_context("spawn")
+        events = ctx.Queue()
+        # Havuz dosyaları paralel işler; dosya içi paralellik burada kullanılmaz
+        options = {**self.options, "workers": 1, "split_pages": False}
+        observer = self._start_observer()
+        server = self._start_server()
+        self.log(f"İzleniyor: {self.input_folder} -> {self.output_folder} "
+                 f"({workers} işçi, {'olay tabanlı' if observer else 'periyodik tarama'})")
+        try:
+            # Bir işçi çökerse havuz bozulur; yenisi kurulup izlemeye devam edilir
+            while not self._stop.is_set():
+                with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker,
+                                         initargs=(events, self.control)) as pool:
+                    self._serve(pool, workers, events, options, observer is not None)
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            if server is not None:
+                server.shutdown()
+            self._update_status()
+            self.log("İzleme durduruldu")
+
+    def _serve(self, pool, workers, events, options, event_driven):
+        """Havuz bozulana ya da servis durdurulana kadar dosyaları dağıt"""
+        last_scan = last_status = 0.0
+        broken = False
+        while not self._stop.is_set() and not broken:
+            now = time.monotonic()
+            scan_interval = RESCAN_INTERVAL if event_driven else self.poll_interval
+            if now - last_scan >= scan_interval:
+                self._scan()
+                last_scan = now
+            self._collect_notified()
+            self._settle(now)
+
+            # Havuzu dolu tut ama fazlasını kuyrukta bekletme; ölçümler gerçek sırayı göstersin
+            while self._waiting and len(self._running) < workers:
+                file_path, detected, version = self._waiting.popleft()
+                index = self._next_index
+                self._next_index += 1
+                self._paths[index] = file_path
+                future = pool.submit(_compress_file_worker, index, file_path, self.output_folder, options)
+                self._running[future] = (file_path, detected, time.monotonic(), version, index)
+
+            if self._running:
+                done, _ = wait(self._running, timeout=0.2, return_when=FIRST_COMPLETED)
+            else:
+                done = ()
+                self._stop.wait(0.2)
+            self._drain_events(events)
+            for future in done:
+                broken = self._finish(future) or broken
+            if time.monotonic() - last_status >= STATUS_INTERVAL:
+                self._update_status()
+                last_status = time.monotonic()
+
+        # Çalışanların bitmesini (durdurulurken sayfa arasında durmasını) bekle
+        if self._running:
+            wait(self._running)
+            self._drain_events(events)
+            for future in list(self._running):
+                self._finish(future)
+
+    def _start_observer(self):
+        if not self.use_events:
+            return None
+        observer = Observer()
+        observer.schedule(_EventHandler(self._notified.put), self.input_folder, recursive=False)
+        observer.start()
+        return observer
+
+    def _start_server(self):
+        if not self.status_port:
+            return None
+        watcher = self
+
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(watcher.status(), ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # İstek günlüğü servis günlüğünü doldurmasın
+
+        server = ThreadingHTTPServer(("127.0.0.1", self.status_port), StatusHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.log(f"Durum: http://127.0.0.1:{server.server_address[1]}/")
+        return server
+
+    def _scan(self):
+        try:
+            entries = list(os.scandir(self.input_folder))
+        except OSError as e:
+            self.log(f"⚠️ Klasör okunamadı: {e}")
+            return
+        for entry in entries:
+            if entry.is_file():
+                self._notified.put(entry.path)
+        # Klasörden kalkan dosyaların kayıtları sınırsız büyümesin
+        present = {entry.path for entry in entries}
+        for file_path in [file_path for file_path in self._done if file_path not in present]:
+            del self._done[file_path]
+
+    def _collect_notified(self):
+        while True:
+            try:
+                file_path = self._notified.get_nowait()
+            except queue.Empty:
+                return
+            if not _is_pdf(file_path) or file_path in self._candidates:
+                continue
+            if (self.output_folder == self.input_folder
+                    and os.path.basename(file_path).endswith("_compressed.pdf")):
+                continue  # Çıktılar aynı klasöre yazılıyorsa kendi çıktılarımız
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            if self._done.get(file_path) != (stat.st_size, stat.st_mtime_ns):
+                self._candidates[file_path] = (None, None, None, time.monotonic())
+
+    def _settle(self, now):
+        """Yazımı biten, daha önce işlenmemiş adayları bekleme kuyruğuna al"""
+        queued = {file_path for file_path, _, _ in self._waiting}
+        queued.update(file_path for file_path, *_ in self._running.values())
+        for file_path, (size, mtime, since, detected) in list(self._candidates.items()):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                del self._candidates[file_path]  # Dosya silinmiş ya da taşınmış
+                continue
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime):
+                self._candidates[file_path] = (stat.st_size, stat.st_mtime_ns, now, detected)
+                continue
+            if now - since < SETTLE_SECONDS or file_path in queued:
+                continue
+            del self._candidates[file_path]
+            if self._output_is_current(file_path, stat):
+                self._done[file_path] = (size, mtime)
+                continue
+            self._waiting.append((file_path, detected, (size, mtime)))
+
+    def _output_is_current(self, file_path, stat):
+        try:
+            return os.stat(_output_path(file_path, self.output_folder)).st_mtime_ns >= stat.st_mtime_ns
+        except OSError:
+            return False
+
+    def _drain_events(self, events):
+        # Olaylar sonuçtan az sonra gelebilir; biten dosyaların yolu bir boşaltma daha tutulur
+        retired, self._retired = self._retired, []
+        while True:
+            try:
+                event = events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == "log":
+                _, index, message = event
+                self.log(f"[{os.path.basename(self._paths.get(index, '?'))}] {message}")
+        for index in retired:
+            self._paths.pop(index, None)
+
+    def _finish(self, future):
+        """Biten dosyanın ölçümlerini işle; havuz bozulduysa True döndür"""
+        file_path, detected, started, version, index = self._running.pop(future)
+        self._retired.append(index)
+        finished = time.monotonic()
+        error = future.exception()
+        if isinstance(error, CompressionCancelled):
+            return False  # Çıktı yazılmadı; servis yeniden başlayınca tekrar işlenir
+        # Hatalı dosyalar da değişene kadar yeniden denenmez
+        self._done[file_path] = version
+        if error is not None:
+            self._totals["failed"] += 1
+            self.log(f"❌ Hata ({os.path.basename(file_path)}): {error}")
+            if isinstance(error, BrokenProcessPool):
+                self.log("⚠️ İşçi süreç çöktü, havuz yeniden başlatılıyor")
+                return True
+            return False
+        result = future.result()
+        if self.options["result_cache"]:
+            _store_results(self.options["result_cache"], [result], "cache_key")
+            self._totals["cached"] += result["cached"]
+        self._totals["processed"] += 1
+        self._totals["bytes_in"] += result["original_size"]
+        self._totals["bytes_out"] += result["compressed_size"]
+        self._recent.append((finished, finished - detected, finished - started,
+                             result["original_size"], result["compressed_size"]))
+        return False
+
+    def status(self):
+        with self._status_lock:
+            return dict(self._status)
+
+    def _update_status(self):
+        now = time.monotonic()
+        recent = list(self._recent)
+        latencies = sorted(latency for _, latency, _, _, _ in recent)
+        span = now - recent[0][0] if len(recent) > 1 else 0.0
+        status = {
+            "input": self.input_folder,
+            "output": self.output_folder,
+            "uptime": round(time.time() - self._started, 1),
+            "watching": "events" if self.use_events else "polling",
+            "queue_depth": len(self._waiting) + len(self._candidates),
+            "in_progress": len(self._running),
+            **self._totals,
+            "saved": format_size(self._totals["bytes_in"] - self._totals["bytes_out"]),
+            # Verim: penceredeki dosyaların tamamlanma hızı (dosya/dakika)
+            "files_per_minute": round((len(recent) - 1) / span * 60, 2) if span else 0.0,
+            "latency_avg": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            "latency_p95": latencies[int(len(latencies) * 0.95)] if latencies else None,
+            "processing_avg": (round(sum(seconds for _, _, seconds, _, _ in recent) / len(recent), 3)
+                               if recent else None),
+        }
+        if status["latency_p95"] is not None:
+            status["latency_p95"] = round(status["latency_p95"], 3)
+        with self._status_lock:
+            self._status = status
+        if self.status_path:
+            _write_json_atomic(self.status_path, status)
+